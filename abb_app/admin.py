@@ -1,8 +1,14 @@
 from django.contrib import admin
 from .models import AbbreviationEntry
+from .services.dictionary import schedule_dictionary_version_bump
+from .services.search import index_entries
 
 def approve_entries(modeladmin, request, queryset):
+        ids = list(queryset.values_list('pk', flat=True))
         queryset.update(status='approved')
+        # update() sends no signals, the search table is synced here
+        index_entries(AbbreviationEntry.objects.filter(pk__in=ids))
+        schedule_dictionary_version_bump()
         modeladmin.message_user(request, f"{queryset.count()} entries approved.")
                
 @admin.register(AbbreviationEntry)
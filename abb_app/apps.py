@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+class AbbAppConfig(AppConfig):
+    name = 'abb_app'
+
+    def ready(self):
+        from abb_app import signals
+
+        post_migrate.connect(signals.create_search_index, sender=self)
@@ -0,0 +1,61 @@
+"""
+Context search of 1k abbreviations, single trie pass vs. threaded search.
+
+Usage: python -m abb_app.benchmarks.context_search [--tokens N]
+       [--abbreviations N] [--threads N ...]
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from abb_app.benchmarks.token_classifier import build_text
+from abb_app.utils import ContextFinder
+
+
+def build_abbreviations(count: int) -> list:
+    return [f'AB{number}' for number in range(count)]
+
+
+def build_document(token_count: int, abbreviations: list) -> str:
+    """Document text with every abbreviation spread over the words."""
+    words = build_text(token_count).split()
+    step = max(1, len(words) // (len(abbreviations) * 3))
+    for index in range(0, len(words), step):
+        words[index] = abbreviations[index // step % len(abbreviations)]
+    return ' '.join(words)
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<28} {elapsed:>10.3f} s')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tokens', type=int, default=500_000)
+    parser.add_argument('--abbreviations', type=int, default=1000)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    abbreviations = build_abbreviations(args.abbreviations)
+    text = build_document(args.tokens, abbreviations)
+
+    # A finder is built for every file, so its patterns are compiled each time
+    measure(
+        'single pass',
+        lambda: ContextFinder(abbreviations).find_contexts(text),
+    )
+    for threads in args.threads:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            measure(
+                f'threaded, {threads} threads',
+                lambda: ContextFinder(abbreviations).find_contexts(
+                    text, executor=executor, task_count=threads
+                ),
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Descriptions per second of alphabet detection and splitting by language,
+regex searches per word vs. the precomputed script table.
+
+Usage: python -m abb_app.benchmarks.script_classifier [--descriptions N]
+"""
+import argparse
+import random
+import time
+
+import regex
+
+from abb_app.utils import (
+    detect_string_alphabet,
+    get_script_classifier,
+    split_by_language,
+)
+
+
+DESCRIPTIONS = [
+    'электрокардиография (electrocardiography)',
+    'артериальное давление',
+    'магнитно-резонансная томография, MRI',
+    'alanine aminotransferase (аланинаминотрансфераза)',
+    'гликированный гемоглобин HbA1c',
+    'индекс массы тела, кг/м²',
+    'интерлейкин-6 (IL-6); interleukin 6',
+    'скорость клубочковой фильтрации',
+]
+
+
+def regex_alphabet(text: str) -> str:
+    """Alphabet detection before the script table."""
+    has_russian = bool(regex.search(r'\p{Script=Cyrillic}', text))
+    has_latin = bool(regex.search(r'\p{Script=Latin}', text))
+    if has_russian and has_latin:
+        return 'mixed'
+    elif has_russian:
+        return 'russian'
+    elif has_latin:
+        return 'latin'
+    return 'other'
+
+
+def regex_split(text: str) -> tuple:
+    """Splitting by language before the script table."""
+    russian_parts = []
+    latin_parts = []
+    pattern = r'[\p{Script=Cyrillic}\p{Script=Latin}\p{N}_-]+[.,;:!?]*|\S'
+    for word in regex.findall(pattern, text):
+        lang = regex_alphabet(word)
+        if lang == 'russian':
+            russian_parts.append(word)
+        elif lang == 'latin':
+            latin_parts.append(word)
+    return (
+        regex.sub(r'[.,;:!?]+$', '', ' '.join(russian_parts)),
+        regex.sub(r'[.,;:!?]+$', '', ' '.join(latin_parts)),
+    )
+
+
+def measure(label: str, count: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<32} {count / elapsed:>14,.0f} descriptions/s')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--descriptions', type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    descriptions = rng.choices(DESCRIPTIONS, k=args.descriptions)
+    get_script_classifier()
+
+    def run(alphabet, split):
+        for description in descriptions:
+            alphabet(description)
+            split(description)
+
+    measure(
+        'regex per word (before)', args.descriptions,
+        lambda: run(regex_alphabet, regex_split),
+    )
+    measure(
+        'script table', args.descriptions,
+        lambda: run(detect_string_alphabet, split_by_language),
+    )
+
+
+if __name__ == '__main__':
+    main()
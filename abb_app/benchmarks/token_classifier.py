@@ -0,0 +1,143 @@
+"""
+Tokens per second of candidate detection: the original per-token
+implementation vs. the deduplicated path.
+
+Usage: python -m abb_app.benchmarks.token_classifier [--tokens N]
+"""
+import argparse
+import random
+import re
+import time
+from collections import Counter
+from typing import Set
+
+from abb_app.utils import TextProcessor
+
+
+VOCABULARY = (
+    'пациент исследование препарат терапия доза приема период оценка '
+    'безопасности эффективности группы лечения нежелательных явлений '
+    'результаты анализа данных протокола визита скрининга рандомизации'
+).split()
+ABBREVIATIONS = [
+    'ЭКГ', 'АД', 'ЧСС', 'ALT', 'AST', 'HbA1c', 'IgG', 'ИМТ', 'СКФ', 'МРТ',
+    'ЭКГ,', '(АД)', 'ALT/AST', 'IgG-антитела', 'II', 'IIIA', 'ПРОТОКОЛ',
+]
+
+
+def build_text(token_count: int, seed: int = 0) -> str:
+    """Builds text with a Zipf-like token distribution of a real document."""
+    rng = random.Random(seed)
+    vocabulary = VOCABULARY + ABBREVIATIONS + [
+        f'{word}{suffix}' for word in VOCABULARY for suffix in ('а', 'ы', 'ом')
+    ] + [str(number) for number in range(2000)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return ' '.join(rng.choices(vocabulary, weights, k=token_count))
+
+
+def clean_abbreviation(match: str) -> str:
+    """`_clean_abbreviation` before the patterns were precompiled."""
+    clean_match = match.strip(':;,.»«][')
+    if clean_match.startswith('('):
+        clean_match = clean_match[1:]
+    if clean_match.endswith(')') and clean_match.count('(') == 0:
+        clean_match = re.sub(r'\)+$', '', clean_match)
+    return clean_match.strip('»«][')
+
+
+def extract_each_token(
+        processor: TextProcessor,
+        text: str,
+        known_abbreviations: Set[str]
+    ) -> Counter:
+    """
+    `extract_abbreviations` before the change: every token is cleaned and
+    classified with per-call `re` functions, then compound and derived
+    forms are pruned.
+    """
+    doc_abbs: Counter = Counter()
+    text_no_quotes = re.compile(r'«\S+?»|"[^"]+"').sub('', text)
+
+    for word in text_no_quotes.split():
+        candidate = clean_abbreviation(word)
+        if not candidate:
+            continue
+        if candidate in known_abbreviations:
+            doc_abbs[candidate] += 1
+            continue
+        if not re.search(r'[A-ZА-ЯЁ].*[A-ZА-ЯЁ]', candidate):
+            continue
+        if TextProcessor._is_roman_token(candidate):
+            continue
+        if candidate in processor.exclude_terms:
+            continue
+        if len(candidate) > 8 and candidate.isalpha():
+            continue
+        doc_abbs[candidate] += 1
+
+    standalone = set(doc_abbs)
+    for candidate in list(doc_abbs):
+        if candidate in known_abbreviations:
+            continue
+
+        parts = candidate.split('/')
+        if (
+            len(parts) > 1
+            and all(parts)
+            and all(part in standalone for part in parts)
+        ):
+            del doc_abbs[candidate]
+            continue
+
+        for abbreviation in standalone:
+            if abbreviation == candidate:
+                continue
+            if candidate.startswith(f'{abbreviation}-'):
+                affix = candidate[len(abbreviation) + 1:]
+            elif candidate.endswith(f'-{abbreviation}'):
+                affix = candidate[:-len(abbreviation) - 1]
+            else:
+                continue
+            if (
+                len(affix) >= 2
+                and re.fullmatch(r'[А-Яа-яЁё]+', affix)
+                and re.search(r'[а-яё]', affix)
+            ):
+                del doc_abbs[candidate]
+                break
+
+    return doc_abbs
+
+
+def measure(label: str, token_count: int, func) -> None:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<28} {token_count / elapsed:>14,.0f} tokens/s')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tokens', type=int, default=500_000)
+    args = parser.parse_args()
+
+    text = build_text(args.tokens)
+    processor = TextProcessor()
+
+    measure(
+        'per-token (before)', args.tokens,
+        lambda: extract_each_token(processor, text, set()),
+    )
+    TextProcessor._classify_token.cache_clear()
+    measure(
+        'deduplicated, cold cache', args.tokens,
+        lambda: processor.index_abbreviations(text, set()),
+    )
+    measure(
+        'deduplicated, warm cache', args.tokens,
+        lambda: processor.index_abbreviations(text, set()),
+    )
+
+
+if __name__ == '__main__':
+    main()
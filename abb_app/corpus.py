@@ -0,0 +1,209 @@
+"""
+Dictionary pairs with contexts extracted from a corpus of Word files.
+
+`extract_file` is a module-level function, so `extract_abbs_word_to_csv`
+can run it in the parent process or fan the files out to a process pool
+and merge the partial results. `CorpusCache` keeps the results of files
+between runs, so only added and changed files are extracted again.
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .docx_reader import DocxReader
+from .utils import ContextFinder, TextProcessor
+
+Pairs = Dict[Tuple[str, str], Set[str]]
+
+text_processor = TextProcessor()
+
+
+@dataclass(frozen=True)
+class FileResult:
+    filename: str
+    size: int
+    pairs: Pairs = field(default_factory=dict)
+    read_time: float = 0.0
+    context_time: float = 0.0
+    error: Optional[str] = None
+
+
+def extract_file(
+        filepath: str,
+        window: int,
+        max_contexts: int,
+        executor: Optional[Executor] = None,
+        task_count: int = 1
+    ) -> FileResult:
+    """
+    Pairs of the abbreviation table of a file, with contexts of the
+    abbreviation in the text. Errors are returned, not raised, so one bad
+    file does not stop a pool.
+    """
+    filename = os.path.basename(filepath)
+    size = os.path.getsize(filepath)
+    try:
+        start_time = time.time()
+        abb_table, text = text_processor.read_document(DocxReader(filepath))
+        read_time = time.time() - start_time
+
+        start_time = time.time()
+        context_finder = ContextFinder(abb['abbreviation'] for abb in abb_table)
+        all_contexts = context_finder.find_contexts(
+            text,
+            window=window,
+            max_contexts=max_contexts,
+            executor=executor,
+            task_count=task_count
+        )
+        pairs: Pairs = {}
+        for abb in abb_table:
+            contexts = all_contexts.get(abb['abbreviation'])
+            if contexts:
+                for desc in abb['descriptions']:
+                    key = (abb['abbreviation'], desc.strip().lower())
+                    pairs.setdefault(key, set()).update(contexts)
+        context_time = time.time() - start_time
+    except Exception as e:
+        return FileResult(filename, size, error=str(e))
+
+    return FileResult(filename, size, pairs, read_time, context_time)
+
+
+def merge_pairs(target: Pairs, pairs: Pairs) -> None:
+    for key, contexts in pairs.items():
+        target.setdefault(key, set()).update(contexts)
+
+
+class CorpusCache:
+    """
+    Manifest of extracted files with their results on disk.
+
+    The manifest records the size, mtime and SHA-256 of each file. A file
+    with the same size and mtime is not read at all, a touched file with
+    the same content is recognized by its hash. Results are gzipped JSON
+    named by the content hash and the extraction settings, so copies of a
+    file share them and results of other settings are not reused.
+    """
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, directory: str, window: int, max_contexts: int):
+        self.directory = directory
+        self.settings = {'window': window, 'max_contexts': max_contexts}
+        self._suffix = f'w{window}-c{max_contexts}'
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._previous: Dict[str, Dict[str, Any]] = {}
+        self._changed: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            with open(self._path(self.MANIFEST), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        if manifest.get('settings') == self.settings:
+            self._previous = manifest['files']
+
+    def lookup(self, filepath: str) -> Optional[Pairs]:
+        """Cached pairs of the file if its content is unchanged."""
+        stat = os.stat(filepath)
+        entry = self._previous.get(filepath)
+        if (
+            entry is None
+            or entry['size'] != stat.st_size
+            or entry['mtime_ns'] != stat.st_mtime_ns
+        ):
+            digest = file_digest(filepath)
+            entry = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': digest,
+            }
+            if not os.path.exists(self._result_path(digest)):
+                self._changed[filepath] = entry
+                return None
+
+        try:
+            pairs = self._read_result(entry['sha256'])
+        except (OSError, ValueError):
+            return None
+        self.files[filepath] = entry
+        return pairs
+
+    def store(self, filepath: str, pairs: Pairs) -> None:
+        entry = self._changed.pop(filepath, None)
+        if entry is None:
+            stat = os.stat(filepath)
+            entry = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': file_digest(filepath),
+            }
+        digest = entry['sha256']
+        self.files[filepath] = entry
+        data = [
+            [abbreviation, description, sorted(contexts)]
+            for (abbreviation, description), contexts in pairs.items()
+        ]
+        self._write(
+            self._result_path(digest),
+            gzip.compress(json.dumps(data, ensure_ascii=False).encode('utf-8')),
+        )
+
+    def save(self) -> None:
+        """
+        Writes the manifest of the files looked up or stored in this run,
+        so deleted files drop out, and removes results nobody refers to.
+        """
+        manifest = {'settings': self.settings, 'files': self.files}
+        self._write(
+            self._path(self.MANIFEST),
+            json.dumps(manifest, ensure_ascii=False).encode('utf-8'),
+        )
+
+        used = {self._result_name(entry['sha256']) for entry in self.files.values()}
+        results_dir = self._path('results')
+        os.makedirs(results_dir, exist_ok=True)
+        for name in os.listdir(results_dir):
+            if name not in used:
+                os.unlink(os.path.join(results_dir, name))
+
+    def _read_result(self, digest: str) -> Pairs:
+        with open(self._result_path(digest), 'rb') as f:
+            data = json.loads(gzip.decompress(f.read()))
+        return {
+            (abbreviation, description): set(contexts)
+            for abbreviation, description, contexts in data
+        }
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _result_name(self, digest: str) -> str:
+        return f'{digest}-{self._suffix}.json.gz'
+
+    def _result_path(self, digest: str) -> str:
+        return self._path(os.path.join('results', self._result_name(digest)))
+
+    @staticmethod
+    def _write(path: str, content: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+def file_digest(filepath: str) -> str:
+    with open(filepath, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
@@ -0,0 +1,419 @@
+"""
+Compiled read-only snapshot of the approved dictionary.
+
+Worker processes `mmap` the same file, so its pages are shared through the
+page cache instead of being copied into every worker, and opening it costs
+no parsing.
+
+The file is a header followed by sections padded to 4 bytes. Integers are
+unsigned 32-bit in native byte order:
+
+    version               dictionary version the snapshot was built from
+    keys                  sorted abbreviations (offsets, UTF-8 blob)
+    description ranges    first description of each key, n + 1 items
+    descriptions          descriptions of all keys (offsets, UTF-8 blob)
+    skeletons             sorted homoglyph skeletons (offsets, UTF-8 blob)
+    skeleton ranges       first entry of each skeleton, k + 1 items
+    skeleton entries      key indices grouped by skeleton
+    suggestion settings   max distance and prefix length
+    deletes               sorted delete forms of `SuggestionIndex`
+    delete ranges         first entry of each form, d + 1 items
+    delete entries        key indices grouped by delete form
+    trie ranges           first edge of each automaton node, t + 1 items
+    trie chars            code points of the edges, sorted in each node
+    trie targets          node each edge leads to
+    trie terminals        key index + 1 ending at each node, 0 for none
+
+The lookup structures are stored too, so workers read them from the
+shared pages instead of building them from the entries.
+"""
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .utils import (
+    Abbreviation,
+    CharacterValidator,
+    ContextFinder,
+    SuggestionIndex,
+    build_automaton,
+    is_word_char,
+)
+
+
+MAGIC = b'ABBDICT' + (b'L' if sys.byteorder == 'little' else b'B')
+HEADER = struct.Struct('=8sI')
+SECTION_COUNT = 19
+
+
+class StringTable:
+    """Strings stored as end offsets into a UTF-8 blob."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self.offsets = offsets
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return str(self.raw(index), 'utf-8')
+
+    def raw(self, index: int) -> bytes:
+        return bytes(self.blob[self.offsets[index]:self.offsets[index + 1]])
+
+    def find(self, value: str) -> int:
+        """Index of `value` in a sorted table, or -1."""
+        # UTF-8 bytes sort in the same order as the strings
+        key = value.encode('utf-8')
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.raw(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self) and self.raw(low) == key:
+            return low
+        return -1
+
+    @staticmethod
+    def build(values: Sequence[str]) -> Tuple[array, bytes]:
+        encoded = [value.encode('utf-8') for value in values]
+        offsets = array('I', [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        return offsets, b''.join(encoded)
+
+
+class SnapshotEntries(Mapping):
+    """Dictionary entries by abbreviation, read from the snapshot."""
+
+    def __init__(self, snapshot: 'DictionarySnapshot'):
+        self.snapshot = snapshot
+
+    def __getitem__(self, abb: str) -> Abbreviation:
+        index = self.snapshot.keys.find(abb)
+        if index < 0:
+            raise KeyError(abb)
+        return self.snapshot.entry(index)
+
+    def __contains__(self, abb: object) -> bool:
+        return isinstance(abb, str) and self.snapshot.keys.find(abb) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        keys = self.snapshot.keys
+        return (keys[index] for index in range(len(keys)))
+
+    def __len__(self) -> int:
+        return len(self.snapshot.keys)
+
+    def __reduce__(self):
+        return getattr, (self.snapshot, 'by_abbreviation')
+
+
+class SnapshotHomoglyphIndex:
+    """`HomoglyphIndex` lookups answered from the snapshot."""
+
+    def __init__(self, snapshot: 'DictionarySnapshot'):
+        self.snapshot = snapshot
+        self.skeleton_table = CharacterValidator().skeleton_table
+
+    def lookup(self, abb: str) -> List[Abbreviation]:
+        snapshot = self.snapshot
+        index = snapshot.skeletons.find(abb.translate(self.skeleton_table))
+        if index < 0:
+            return []
+
+        entries = []
+        start, end = snapshot.skeleton_ranges[index:index + 2]
+        for key_index in snapshot.skeleton_entries[start:end]:
+            if snapshot.keys[key_index] != abb:
+                entries.append(snapshot.entry(key_index))
+        return entries
+
+    def __reduce__(self):
+        return getattr, (self.snapshot, 'homoglyph_index')
+
+
+class SnapshotSuggestionIndex(SuggestionIndex):
+    """`SuggestionIndex` reading the delete forms from the snapshot."""
+
+    def __init__(self, snapshot: 'DictionarySnapshot'):
+        self.snapshot = snapshot
+        self.max_distance, self.prefix_length = snapshot.suggestion_settings
+
+    def entries(self, form: str) -> List[str]:
+        snapshot = self.snapshot
+        index = snapshot.deletes.find(form)
+        if index < 0:
+            return []
+        start, end = snapshot.delete_ranges[index:index + 2]
+        return [
+            snapshot.keys[key_index]
+            for key_index in snapshot.delete_entries[start:end]
+        ]
+
+    def __reduce__(self):
+        return getattr, (self.snapshot, 'suggestion_index')
+
+
+class SnapshotContextFinder(ContextFinder):
+    """
+    `ContextFinder` walking the trie stored in the snapshot. The edges of
+    a node are sorted, so each step is a binary search.
+    """
+
+    def __init__(self, snapshot: 'DictionarySnapshot'):
+        self.snapshot = snapshot
+        start, end = snapshot.trie_ranges[0:2]
+        first_chars = ''.join(
+            re.escape(chr(code)) for code in snapshot.trie_chars[start:end]
+        )
+        self.start_pattern = (
+            re.compile(rf'(?<!\w)[{first_chars}]') if first_chars else None
+        )
+        self._group_patterns = {}
+
+    @cached_property
+    def _abbreviations(self) -> List[str]:
+        """Entries of the automaton, for the concurrent search."""
+        snapshot = self.snapshot
+        return sorted(
+            (
+                snapshot.keys[terminal - 1]
+                for terminal in snapshot.trie_terminals if terminal
+            ),
+            key=len,
+        )
+
+    def find_occurrences(
+            self,
+            text: str,
+            executor: Optional[Executor] = None,
+            task_count: int = 1
+        ) -> Dict[str, List[int]]:
+        if executor is not None:
+            return self._find_occurrences_concurrent(text, executor, task_count)
+
+        occurrences: Dict[str, List[int]] = {}
+        if self.start_pattern is None:
+            return occurrences
+
+        snapshot = self.snapshot
+        ranges = snapshot.trie_ranges
+        chars = snapshot.trie_chars
+        targets = snapshot.trie_targets
+        terminals = snapshot.trie_terminals
+        text_length = len(text)
+        for match in self.start_pattern.finditer(text):
+            start = match.start()
+            position = start
+            node = 0
+            while position < text_length:
+                code = ord(text[position])
+                end = ranges[node + 1]
+                edge = bisect_left(chars, code, ranges[node], end)
+                if edge == end or chars[edge] != code:
+                    break
+                node = targets[edge]
+                position += 1
+
+                terminal = terminals[node]
+                if terminal and (
+                    position == text_length
+                    or not is_word_char(text[position])
+                ):
+                    occurrences.setdefault(
+                        snapshot.keys[terminal - 1], []
+                    ).append(start)
+
+        return occurrences
+
+    def __reduce__(self):
+        return getattr, (self.snapshot, 'automaton')
+
+
+class DictionarySnapshot:
+    """
+    Memory-mapped dictionary with the interface of `AbbreviationDictionary`
+    used by `process_abbreviations`. Pickles as its path, so worker
+    processes of an executor map the file themselves.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        sections = _read_sections(memoryview(self._mmap))
+        self.version = str(sections[0], 'utf-8')
+        self.keys = StringTable(sections[1].cast('I'), sections[2])
+        self.description_ranges = sections[3].cast('I')
+        self.descriptions = StringTable(sections[4].cast('I'), sections[5])
+        self.skeletons = StringTable(sections[6].cast('I'), sections[7])
+        self.skeleton_ranges = sections[8].cast('I')
+        self.skeleton_entries = sections[9].cast('I')
+        self.suggestion_settings = tuple(sections[10].cast('I'))
+        self.deletes = StringTable(sections[11].cast('I'), sections[12])
+        self.delete_ranges = sections[13].cast('I')
+        self.delete_entries = sections[14].cast('I')
+        self.trie_ranges = sections[15].cast('I')
+        self.trie_chars = sections[16].cast('I')
+        self.trie_targets = sections[17].cast('I')
+        self.trie_terminals = sections[18].cast('I')
+
+        self.by_abbreviation = SnapshotEntries(self)
+        self.abbreviations = self.by_abbreviation
+        self.homoglyph_index = SnapshotHomoglyphIndex(self)
+        self.suggestion_index = SnapshotSuggestionIndex(self)
+        self.automaton = SnapshotContextFinder(self)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __reduce__(self):
+        return DictionarySnapshot, (self.path,)
+
+    def entry(self, index: int) -> Abbreviation:
+        start, end = self.description_ranges[index:index + 2]
+        return {
+            'abbreviation': self.keys[index],
+            'descriptions': [
+                self.descriptions[position] for position in range(start, end)
+            ],
+        }
+
+
+def open_snapshot(path: str, version: str) -> Optional[DictionarySnapshot]:
+    """Opens the snapshot if it exists and was built from `version`."""
+    try:
+        snapshot = DictionarySnapshot(path)
+    except (FileNotFoundError, ValueError):
+        return None
+    return snapshot if snapshot.version == version else None
+
+
+def write_snapshot(
+        path: str,
+        entries: List[Abbreviation],
+        version: str
+    ) -> None:
+    """Compiles the dictionary and swaps the snapshot file atomically."""
+    entries = sorted(entries, key=lambda entry: entry['abbreviation'])
+    keys = [entry['abbreviation'] for entry in entries]
+
+    description_ranges = array('I', [0])
+    descriptions: List[str] = []
+    for entry in entries:
+        descriptions.extend(entry['descriptions'])
+        description_ranges.append(len(descriptions))
+
+    skeleton_table = CharacterValidator().skeleton_table
+    groups: dict = {}
+    for index, key in enumerate(keys):
+        groups.setdefault(key.translate(skeleton_table), []).append(index)
+    skeletons = sorted(groups)
+    skeleton_ranges = array('I', [0])
+    skeleton_entries = array('I')
+    for skeleton in skeletons:
+        skeleton_entries.extend(groups[skeleton])
+        skeleton_ranges.append(len(skeleton_entries))
+
+    key_indices = {key: index for index, key in enumerate(keys)}
+    suggestion_index = SuggestionIndex(keys)
+    deletes = sorted(suggestion_index.deletes)
+    delete_ranges = array('I', [0])
+    delete_entries = array('I')
+    for form in deletes:
+        delete_entries.extend(
+            key_indices[key] for key in suggestion_index.deletes[form]
+        )
+        delete_ranges.append(len(delete_entries))
+
+    sections = [
+        version.encode('utf-8'),
+        *StringTable.build(keys),
+        description_ranges,
+        *StringTable.build(descriptions),
+        *StringTable.build(skeletons),
+        skeleton_ranges,
+        skeleton_entries,
+        array('I', [
+            suggestion_index.max_distance,
+            suggestion_index.prefix_length,
+        ]),
+        *StringTable.build(deletes),
+        delete_ranges,
+        delete_entries,
+        *_flatten_trie(build_automaton(keys).trie, key_indices),
+    ]
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            _write_sections(f, sections)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _flatten_trie(
+        trie: dict,
+        key_indices: Dict[str, int]
+    ) -> Tuple[array, array, array, array]:
+    """Nodes of a `ContextFinder` trie numbered breadth first."""
+    ranges = array('I', [0])
+    chars = array('I')
+    targets = array('I')
+    terminals = array('I')
+    nodes = [trie]
+    for node in nodes:
+        terminal = node.get(ContextFinder.TERMINAL)
+        terminals.append(0 if terminal is None else key_indices[terminal] + 1)
+        for char in sorted(char for char in node if char != ContextFinder.TERMINAL):
+            chars.append(ord(char))
+            targets.append(len(nodes))
+            nodes.append(node[char])
+        ranges.append(len(chars))
+    return ranges, chars, targets, terminals
+
+
+def _write_sections(f, sections: list) -> None:
+    payloads = [bytes(section) for section in sections]
+    sizes = array('I', [len(payload) for payload in payloads])
+    f.write(HEADER.pack(MAGIC, len(payloads)))
+    f.write(sizes.tobytes())
+    for payload in payloads:
+        f.write(payload)
+        f.write(b'\0' * (-len(payload) % 4))
+
+
+def _read_sections(view: memoryview) -> List[memoryview]:
+    if len(view) < HEADER.size:
+        raise ValueError('Dictionary snapshot is truncated')
+    magic, count = HEADER.unpack_from(view)
+    if magic != MAGIC or count != SECTION_COUNT:
+        raise ValueError('Not a dictionary snapshot of this platform')
+
+    position = HEADER.size + 4 * count
+    sizes = view[HEADER.size:position].cast('I')
+    sections = []
+    for size in sizes:
+        sections.append(view[position:position + size])
+        position += size + (-size % 4)
+    if position > len(view):
+        raise ValueError('Dictionary snapshot is truncated')
+    return sections
@@ -0,0 +1,491 @@
+import posixpath
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from zipfile import ZipFile
+
+from docx.styles import BabelFish
+from lxml import etree
+
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+MC_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+DOCUMENT_PART = 'word/document.xml'
+DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+STYLES_PART = 'word/styles.xml'
+
+# Parts with text, in the order they are streamed after the document body
+CONTENT_PARTS = ('header', 'footer', 'footnotes', 'endnotes')
+
+
+def w(tag: str) -> str:
+    """Qualified name of a WordprocessingML element or attribute."""
+    return f'{{{W_NS}}}{tag}'
+
+
+W_P = w('p')
+W_R = w('r')
+W_TBL = w('tbl')
+W_TR = w('tr')
+W_TC = w('tc')
+W_SDT = w('sdt')
+W_SDT_CONTENT = w('sdtContent')
+W_TXBX_CONTENT = w('txbxContent')
+W_HYPERLINK = w('hyperlink')
+W_T = w('t')
+W_BR = w('br')
+MC_FALLBACK = f'{{{MC_NS}}}Fallback'
+
+# Inline elements whose runs are part of the paragraph text. Deleted runs
+# (`w:del`, `w:moveFrom`) and `mc:Fallback` are not text of the paragraph.
+RUN_CONTAINERS = {
+    W_HYPERLINK, w('ins'), w('moveTo'), w('smartTag'), w('customXml'),
+    W_SDT, W_SDT_CONTENT, w('fldSimple'), w('dir'), w('bdo'),
+    f'{{{MC_NS}}}AlternateContent', f'{{{MC_NS}}}Choice',
+}
+
+# Elements whose children are the top-level blocks of a part
+BLOCK_CONTAINERS = {
+    w('body'), w('hdr'), w('ftr'), w('footnote'), w('endnote')
+}
+
+# Run content translated to text the same way python-docx does
+RUN_TEXT = {
+    w('tab'): '\t',
+    w('ptab'): '\t',
+    w('cr'): '\n',
+    w('noBreakHyphen'): '-',
+}
+FALSE_VALUES = {'0', 'false', 'off'}
+TRUE_VALUES = {'1', 'true', 'on'}
+
+
+@dataclass(frozen=True)
+class DocxParagraph:
+    """Text and formatting flags of a single paragraph."""
+    text: str
+    is_heading: bool
+    is_bold: bool
+    table: Optional[int] = None  # Index of the enclosing top-level table
+    part: str = 'document'  # document, header, footer, footnotes, endnotes
+    text_box: bool = False
+    has_hyperlink: bool = False
+    has_outline: bool = False  # Has explicit paragraph style or outline level
+
+
+class StyleMap:
+    """
+    Heading and bold flags of the document styles.
+
+    Flags are resolved once through `basedOn` chains, so classifying a
+    paragraph or a run is a single dictionary lookup.
+    """
+
+    def __init__(self, styles_root: Optional[etree._Element] = None):
+        # style id -> (is_heading, is_bold), is_bold is None if not set
+        self._styles: Dict[str, Tuple[bool, Optional[bool]]] = {}
+        self._types: Dict[str, str] = {}
+        self.default_paragraph: Tuple[bool, bool] = (False, False)
+
+        if styles_root is not None:
+            self._build(styles_root)
+
+    @classmethod
+    def from_archive(cls, archive: ZipFile) -> 'StyleMap':
+        if STYLES_PART not in archive.namelist():
+            return cls()
+        with archive.open(STYLES_PART) as stream:
+            root = etree.parse(
+                stream, etree.XMLParser(resolve_entities=False)
+            ).getroot()
+        return cls(root)
+
+    def paragraph(self, style_id: Optional[str]) -> Tuple[bool, bool]:
+        """Returns (is_heading, is_bold) of a paragraph style."""
+        if self._types.get(style_id) != 'paragraph':
+            return self.default_paragraph
+        is_heading, is_bold = self._styles[style_id]
+        return is_heading, bool(is_bold)
+
+    def character_bold(self, style_id: Optional[str]) -> Optional[bool]:
+        """Returns bold set by a character style, or None."""
+        if self._types.get(style_id) != 'character':
+            return None
+        return self._styles[style_id][1]
+
+    def _build(self, root: etree._Element) -> None:
+        definitions = {}
+        default_id = None
+        for style in root.iterchildren(w('style')):
+            style_id = style.get(w('styleId'))
+            if style_id is None:
+                continue
+
+            name = style.find(w('name'))
+            based_on = style.find(w('basedOn'))
+            bold = style.find(f'{w("rPr")}/{w("b")}')
+            style_name = BabelFish.internal2ui(
+                name.get(w('val'), '') if name is not None else ''
+            )
+            definitions[style_id] = (
+                style_name.startswith('Heading') or 'Заголовок' in style_name,
+                None if bold is None else (
+                    bold.get(w('val'), 'true') not in FALSE_VALUES
+                ),
+                based_on.get(w('val')) if based_on is not None else None,
+            )
+            self._types[style_id] = style.get(w('type'))
+            if (
+                style.get(w('type')) == 'paragraph'
+                and style.get(w('default')) in TRUE_VALUES
+            ):
+                default_id = style_id
+
+        for style_id in definitions:
+            self._styles[style_id] = self._resolve(style_id, definitions)
+
+        if default_id is not None:
+            is_heading, is_bold = self._styles[default_id]
+            self.default_paragraph = (is_heading, bool(is_bold))
+
+    def _resolve(
+            self,
+            style_id: str,
+            definitions: Dict[str, Tuple[bool, Optional[bool], Optional[str]]]
+        ) -> Tuple[bool, Optional[bool]]:
+        is_heading, is_bold = False, None
+        chain = set()
+        while style_id in definitions and style_id not in chain:
+            chain.add(style_id)
+            if style_id in self._styles:
+                base_heading, base_bold = self._styles[style_id]
+                return (
+                    is_heading or base_heading,
+                    base_bold if is_bold is None else is_bold,
+                )
+
+            own_heading, own_bold, style_id = definitions[style_id]
+            is_heading = is_heading or own_heading
+            if is_bold is None:
+                is_bold = own_bold
+
+        return is_heading, is_bold
+
+
+class DocxReader:
+    """
+    Streams paragraphs and tables of a Word document.
+
+    The document body, headers, footers, footnotes and endnotes are read with
+    `iterparse` directly from the archive. Only one top-level block of a part
+    is kept in memory at a time: a block is cleared as soon as the consumer
+    asks for the next one.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._styles: Optional[StyleMap] = None
+
+    @property
+    def styles(self) -> StyleMap:
+        if self._styles is None:
+            with ZipFile(self.file_path) as archive:
+                self._styles = StyleMap.from_archive(archive)
+        return self._styles
+
+    def iter_body(self) -> Iterator[etree._Element]:
+        """Yields top-level paragraphs, tables and content controls of the body."""
+        with ZipFile(self.file_path) as archive:
+            yield from self._iter_blocks(archive, DOCUMENT_PART)
+
+    def iter_paragraphs(self) -> Iterator[DocxParagraph]:
+        """
+        Yields paragraphs of all text parts in a single pass: the body first,
+        then headers, footers, footnotes and endnotes. Paragraphs of tables
+        and text boxes follow the order of the part.
+        """
+        for part, table, block in self.iter_blocks():
+            yield from self.iter_block_paragraphs(block, part, table)
+
+    def iter_blocks(
+            self,
+            parts: Optional[Set[str]] = None
+        ) -> Iterator[Tuple[str, Optional[int], etree._Element]]:
+        """
+        Yields (part, table index, element) of top-level blocks of the text
+        parts, or of `parts` only. The table index counts tables of a part.
+        """
+        with ZipFile(self.file_path) as archive:
+            for part, part_name in self._content_parts(archive):
+                if parts is not None and part not in parts:
+                    continue
+                table_index = -1
+                for block in self._iter_blocks(archive, part_name):
+                    table = None
+                    if block.tag == W_TBL:
+                        table_index += 1
+                        table = table_index
+                    yield part, table, block
+
+    def read_paragraph(
+            self,
+            element: etree._Element,
+            table: Optional[int] = None,
+            part: str = 'document',
+            text_box: bool = False
+        ) -> DocxParagraph:
+        """Collects text and formatting flags of a `w:p` element."""
+        properties = element.find(w('pPr'))
+        style = outline = None
+        if properties is not None:
+            style = properties.find(w('pStyle'))
+            outline = properties.find(w('outlineLvl'))
+        is_heading, style_bold = self.styles.paragraph(
+            style.get(w('val')) if style is not None else None
+        )
+
+        texts = []
+        is_bold = False
+        for child in element:
+            if child.tag == W_R:
+                run_text = self._run_text(child)
+                texts.append(run_text)
+                if (
+                    not is_bold
+                    and run_text.strip()
+                    and self._is_bold(child, style_bold)
+                ):
+                    is_bold = True
+            elif child.tag in RUN_CONTAINERS:
+                texts.extend(
+                    self._run_text(run) for run in self._iter_runs(child)
+                )
+
+        return DocxParagraph(
+            text=''.join(texts),
+            is_heading=is_heading,
+            is_bold=is_bold,
+            table=table,
+            part=part,
+            text_box=text_box,
+            # Also nested in insertions, fields or content controls
+            has_hyperlink=element.find(f'.//{W_HYPERLINK}') is not None,
+            has_outline=style is not None or outline is not None,
+        )
+
+    def _content_parts(self, archive: ZipFile) -> List[Tuple[str, str]]:
+        """Lists (part type, part name) of the parts containing text."""
+        parts = []
+        if DOCUMENT_RELS_PART in archive.namelist():
+            with archive.open(DOCUMENT_RELS_PART) as stream:
+                root = etree.parse(
+                    stream, etree.XMLParser(resolve_entities=False)
+                ).getroot()
+
+            for relationship in root.iterchildren(f'{{{RELS_NS}}}Relationship'):
+                part = relationship.get('Type', '').rsplit('/', 1)[-1]
+                if (
+                    part not in CONTENT_PARTS
+                    or relationship.get('TargetMode') == 'External'
+                ):
+                    continue
+
+                target = relationship.get('Target', '')
+                part_name = (
+                    target.lstrip('/') if target.startswith('/')
+                    else posixpath.normpath(posixpath.join('word', target))
+                )
+                if part_name in archive.namelist():
+                    parts.append((part, part_name))
+
+        parts.sort(key=lambda item: (CONTENT_PARTS.index(item[0]), item[1]))
+        return [('document', DOCUMENT_PART)] + parts
+
+    @staticmethod
+    def _iter_blocks(
+            archive: ZipFile,
+            part_name: str
+        ) -> Iterator[etree._Element]:
+        with archive.open(part_name) as stream:
+            events = etree.iterparse(
+                stream,
+                events=('end',),
+                # Content controls wrap blocks, their content is nested
+                tag=(W_P, W_TBL, W_SDT),
+                resolve_entities=False,
+            )
+            for _, element in events:
+                parent = element.getparent()
+                if parent is None or parent.tag not in BLOCK_CONTAINERS:
+                    continue
+
+                yield element
+
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    def iter_block_paragraphs(
+            self,
+            block: etree._Element,
+            part: str = 'document',
+            table: Optional[int] = None,
+            text_box: bool = False
+        ) -> Iterator[DocxParagraph]:
+        """Yields paragraphs of a block, descending into cells and text boxes."""
+        if block.tag == W_P:
+            yield self.read_paragraph(block, table, part, text_box)
+            for content in self._text_boxes(block):
+                for child in content:
+                    yield from self.iter_block_paragraphs(
+                        child, part, table, text_box=True
+                    )
+        elif block.tag == W_TBL:
+            for row in block.iterchildren(W_TR):
+                for cell in row.iterchildren(W_TC):
+                    for child in cell:
+                        yield from self.iter_block_paragraphs(
+                            child, part, table, text_box
+                        )
+        elif block.tag == W_SDT:
+            content = block.find(W_SDT_CONTENT)
+            for child in (content if content is not None else ()):
+                yield from self.iter_block_paragraphs(
+                    child, part, table, text_box
+                )
+
+    @staticmethod
+    def _text_boxes(paragraph: etree._Element) -> List[etree._Element]:
+        """
+        Text box contents anchored in the paragraph itself. Nested text boxes
+        belong to their own paragraphs, and `mc:Fallback` repeats the content
+        of `mc:Choice`, so both are left out.
+        """
+        contents = []
+        for content in paragraph.iter(W_TXBX_CONTENT):
+            for ancestor in content.iterancestors():
+                if ancestor is paragraph:
+                    contents.append(content)
+                    break
+                if ancestor.tag in (MC_FALLBACK, W_TXBX_CONTENT):
+                    break
+        return contents
+
+    @classmethod
+    def _iter_runs(cls, container: etree._Element) -> Iterator[etree._Element]:
+        """Runs of an inline container, nested containers included."""
+        for child in container:
+            if child.tag == W_R:
+                yield child
+            elif child.tag in RUN_CONTAINERS:
+                yield from cls._iter_runs(child)
+
+    @staticmethod
+    def _run_text(run: etree._Element) -> str:
+        texts = []
+        for child in run:
+            if child.tag == W_T:
+                texts.append(child.text or '')
+            elif child.tag == W_BR:
+                if child.get(w('type'), 'textWrapping') == 'textWrapping':
+                    texts.append('\n')
+            elif child.tag in RUN_TEXT:
+                texts.append(RUN_TEXT[child.tag])
+        return ''.join(texts)
+
+    def _is_bold(self, run: etree._Element, style_bold: bool) -> bool:
+        """Direct formatting wins over the character and paragraph styles."""
+        properties = run.find(w('rPr'))
+        if properties is None:
+            return style_bold
+
+        bold = properties.find(w('b'))
+        if bold is not None:
+            return bold.get(w('val'), 'true') not in FALSE_VALUES
+
+        character_style = properties.find(w('rStyle'))
+        if character_style is not None:
+            character_bold = self.styles.character_bold(
+                character_style.get(w('val'))
+            )
+            if character_bold is not None:
+                return character_bold
+
+        return style_bold
+
+
+class DocumentVisitor:
+    """
+    Consumer of a `DocumentWalker` pass. Callbacks do nothing by default.
+
+    `parts` limits the parts the visitor needs, None means all of them.
+    A visitor sets `finished` once it needs nothing more from the document.
+    """
+    parts: Optional[Set[str]] = None
+    finished: bool = False
+
+    def start_part(self, part: str) -> None:
+        """Called before the first block of a part."""
+
+    def visit_table(
+            self,
+            element: etree._Element,
+            index: int,
+            part: str
+        ) -> None:
+        """
+        Called with a top-level table before its paragraphs. The element is
+        cleared after the table is visited, so it can't be kept.
+        """
+
+    def visit_paragraph(self, paragraph: DocxParagraph) -> None:
+        """Called for every paragraph, including table cells and text boxes."""
+
+
+class DocumentWalker:
+    """
+    Walks a document once and feeds its blocks to several visitors, so
+    consumers of the same upload share a single traversal.
+    """
+
+    def __init__(self, reader: DocxReader):
+        self.reader = reader
+
+    def walk(self, *visitors: DocumentVisitor) -> None:
+        parts = self._parts(visitors)
+        part = None
+        for block_part, table, block in self.reader.iter_blocks(parts):
+            active = [
+                visitor for visitor in visitors
+                if not visitor.finished
+                and (visitor.parts is None or block_part in visitor.parts)
+            ]
+            if not active:
+                if all(visitor.finished for visitor in visitors):
+                    return
+                continue
+
+            if block_part != part:
+                part = block_part
+                for visitor in active:
+                    visitor.start_part(part)
+
+            if table is not None:
+                for visitor in active:
+                    visitor.visit_table(block, table, part)
+
+            for paragraph in self.reader.iter_block_paragraphs(
+                block, part, table
+            ):
+                for visitor in active:
+                    if not visitor.finished:
+                        visitor.visit_paragraph(paragraph)
+
+    @staticmethod
+    def _parts(visitors) -> Optional[Set[str]]:
+        parts: Set[str] = set()
+        for visitor in visitors:
+            if visitor.parts is None:
+                return None
+            parts.update(visitor.parts)
+        return parts
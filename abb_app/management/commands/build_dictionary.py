@@ -0,0 +1,171 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from django.core.management.base import BaseCommand
+from django.db import connection
+from abb_app.corpus import extract_file
+from abb_app.models import AbbreviationEntry
+from abb_app.services.abbreviations import insert_new_entries, split_new_pairs
+from abb_app.services.dictionary import bump_dictionary_version
+from abb_app.services.search import rebuild_search_index
+from abb_app.utils import clean_dictionary_entry
+import time
+
+class Command(BaseCommand):
+    help = (
+        'Build the dictionary from Word files: extract abbreviation tables, '
+        'clean the entries and import them, without intermediate CSV files'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--input-dir',
+            type=str,
+            default=os.path.join('abb_app', 'data', 'word_files'),
+            help='Directory containing Word files'
+        )
+        parser.add_argument(
+            '--status',
+            type=str,
+            default='for_review',
+            choices=['approved', 'for_review', 'rejected'],
+            help='Set the status for imported entries (default: for_review)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Processes extracting files in parallel'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help=(
+                'Entries checked and inserted per transaction (default: 500, '
+                'at most the query parameter limit of the database)'
+            )
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the counts without writing to the database'
+        )
+
+    def extract(self, filepaths, workers, counts):
+        """
+        Yields the (abbreviation, description) pairs of each file whose
+        abbreviation occurs in the text, as files are extracted.
+        """
+        extract = partial(extract_file, window=50, max_contexts=1)
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        results = (
+            executor.map(extract, filepaths, chunksize=4)
+            if executor else map(extract, filepaths)
+        )
+        try:
+            for result in results:
+                if result.error is not None:
+                    counts['failed_files'] += 1
+                    self.stderr.write(
+                        f"Error processing {result.filename}: {result.error}"
+                    )
+                    continue
+                counts['files'] += 1
+                counts['bytes'] += result.size
+                yield from result.pairs
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def clean(self, pairs, counts):
+        """Yields cleaned pairs, each once."""
+        seen = set()
+        for abb, desc in pairs:
+            counts['extracted'] += 1
+            outcome, cleaned_desc, _ = clean_dictionary_entry(abb, desc)
+            counts[outcome] += 1
+            if cleaned_desc is None:
+                continue
+            pair = (abb, cleaned_desc)
+            if pair in seen:
+                counts['repeated'] += 1
+                continue
+            seen.add(pair)
+            yield pair
+
+    def load(self, pairs, status, batch_size, dry_run, counts):
+        """Inserts new pairs in batches, one transaction per batch."""
+        pairs = iter(pairs)
+        while batch := list(islice(pairs, batch_size)):
+            new_pairs, duplicates = split_new_pairs(batch)
+            counts['existing'] += len(duplicates)
+            if dry_run:
+                counts['inserted'] += len(new_pairs)
+                continue
+            inserted = insert_new_entries([
+                AbbreviationEntry(
+                    abbreviation=abbreviation,
+                    description=description,
+                    status=status
+                )
+                for abbreviation, description in new_pairs
+            ])
+            counts['inserted'] += inserted
+            # Pairs inserted by someone else meanwhile
+            counts['existing'] += len(new_pairs) - inserted
+
+    def handle(self, *args, **options):
+        input_dir = options['input_dir']
+        status = options['status']
+        dry_run = options['dry_run']
+
+        if not os.path.exists(input_dir):
+            self.stderr.write(f"Input directory not found: {input_dir}")
+            return
+
+        # A batch is looked up with one parameter per abbreviation
+        max_batch_size = connection.features.max_query_params
+        if not 0 < options['batch_size'] <= max_batch_size:
+            self.stderr.write(
+                f"--batch-size must be between 1 and {max_batch_size}"
+            )
+            return
+
+        filepaths = [
+            os.path.join(input_dir, filename)
+            for filename in sorted(os.listdir(input_dir))
+            if filename.endswith('.docx')
+        ]
+        counts = Counter()
+        start_time = time.time()
+
+        pairs = self.extract(filepaths, options['workers'], counts)
+        cleaned = self.clean(pairs, counts)
+        self.load(cleaned, status, options['batch_size'], dry_run, counts)
+
+        if counts['inserted'] and status == 'approved' and not dry_run:
+            # bulk_create sends no signals
+            rebuild_search_index()
+            bump_dictionary_version()
+
+        elapsed_time = time.time() - start_time
+        removed = sum(
+            counts[outcome]
+            for outcome in ('one_letter', 'few_capitals', 'mixed', 'no_match')
+        )
+        inserted_label = 'Entries to insert' if dry_run else 'Entries inserted'
+        self.stdout.write(self.style.SUCCESS(
+            f"\n{'Dry run' if dry_run else 'Build'} complete "
+            f"in {elapsed_time:.2f} seconds:\n"
+            f"- Files processed: {counts['files']} "
+            f"({counts['bytes'] / 2**20:.2f} MB, {counts['failed_files']} failed)\n"
+            f"- Pairs extracted: {counts['extracted']}\n"
+            f"- Entries removed by cleaning: {removed}\n"
+            f"- Descriptions cleaned: {counts['cleaned']}\n"
+            f"- Repeated entries after cleaning: {counts['repeated']}\n"
+            f"- Entries already in the database: {counts['existing']}\n"
+            f"- {inserted_label}: {counts['inserted']}"
+        ))
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from abb_app.services.dictionary import build_dictionary_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        'Compile the approved dictionary into the snapshot file mapped by '
+        'workers. Once built, it is rebuilt when outdated by the first worker '
+        'needing the dictionary.'
+    )
+
+    def handle(self, *args, **options):
+        version = build_dictionary_snapshot()
+        self.stdout.write(self.style.SUCCESS(
+            f'Dictionary snapshot {version} saved to '
+            f'{settings.DICTIONARY_SNAPSHOT_FILE}'
+        ))
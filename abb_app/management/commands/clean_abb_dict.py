@@ -1,8 +1,10 @@
 import os
 import csv
-import regex
+import tempfile
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from django.core.management.base import BaseCommand
-from abb_app.utils import detect_string_alphabet, split_by_language
+from abb_app.utils import clean_dictionary_entries
 
 class Command(BaseCommand):
     help = 'Clean abbreviations data by removing mixed-language entries and matching descriptions to abbreviation language'
@@ -20,28 +22,72 @@ class Command(BaseCommand):
             default=os.path.join('abb_app', 'data', 'abb_dict_cleaned.csv'),
             help='Output CSV file for cleaned data'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Processes cleaning chunks of rows, 1 cleans in this process'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows sent to a worker at once'
+        )
+
+    def read_chunks(self, reader, chunk_size):
+        """
+        Yields chunks of rows. Rows are checked as they are read, rows
+        before an invalid one are yielded before the error is raised.
+        """
+        chunk = []
+        for row in reader:
+            if len(row) != 3:
+                if chunk:
+                    yield chunk
+                raise ValueError(
+                    f"\nInvalid row format: {row}. Expected 3 columns."
+                )
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
 
-    def validate_abbreviation_match(self, abb: str, desc: str) -> bool:
+    def clean_chunks(self, chunks, workers):
         """
-        Checks if the description contains words starting with the letters of the abbreviation.
+        Yields each chunk with its cleaning results, in input order. At most
+        two chunks per worker are in flight, so memory stays bounded.
         """
-        if not abb or not desc:
-            return False
-            
-        abb_letters = [c for c in abb.upper() if c.isalpha()]
-        
-        words = regex.findall(r'[\p{L}-]+', desc, regex.UNICODE)
-        
-        first_letters = set()
-        for word in words:
-            if word:
-                first_letters.add(word[0].upper())
-            parts = word.split('-')
-            for part in parts[1:]:
-                if part:
-                    first_letters.add(part[0].upper())
-        
-        return all(letter in first_letters for letter in abb_letters)
+        if workers <= 1:
+            for chunk in chunks:
+                yield chunk, clean_dictionary_entries(
+                    [(abb, desc) for abb, desc, _ in chunk]
+                )
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            error = None
+            try:
+                for chunk in chunks:
+                    # Contexts stay here, workers only need the pairs
+                    pending.append((chunk, executor.submit(
+                        clean_dictionary_entries,
+                        [(abb, desc) for abb, desc, _ in chunk]
+                    )))
+                    if len(pending) >= 2 * workers:
+                        chunk, future = pending.popleft()
+                        yield chunk, future.result()
+            except ValueError as e:
+                # Chunks read before an invalid row are still reported
+                error = e
+            while pending:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+            if error is not None:
+                raise error
 
     def handle(self, *args, **options):
         input_file = options['input_file']
@@ -51,108 +97,53 @@ class Command(BaseCommand):
             self.stderr.write(f"Input file not found: {input_file}")
             return
 
-        cleaned_data = []
+        counts = Counter()
         total_entries = 0
-        skipped_mixed = 0
-        skipped_one_letter = 0
-        skipped_few_capitals = 0
-        skipped_no_match = 0
-        cleaned_descriptions = 0
-        unchanged_descriptions = 0
-        
-        with open(input_file, 'r', encoding='utf-8-sig') as f:
-            reader = csv.reader(f)
-            header = next(reader)
-            
-            for row in reader:
-                total_entries += 1
-                if len(row) != 3:
-                    raise ValueError(
-                        f"\nInvalid row format: {row}. Expected 3 columns."
-                    )
-                
-                abb, desc, contexts = row
-
-                # Skip one-letter abbreviations
-                if len(abb) == 1:
-                    skipped_one_letter += 1
-                    continue
+        output_entries = 0
 
-                # Skip abbreviations without at least two capital letters
-                if not regex.search(r'\p{Lu}.*\p{Lu}', abb, regex.UNICODE):
-                    skipped_few_capitals += 1
-                    continue
-                
-                # Check abbreviation language
-                abb_lang = detect_string_alphabet(abb)
-                
-                # Skip mixed-language abbreviations
-                if abb_lang == 'mixed':
-                    skipped_mixed += 1
-                    continue
-                
-                # Split description by language
-                russian_desc, latin_desc = split_by_language(desc)
-                
-                # Decide which cleaned description to use
-                if abb_lang == 'russian' and russian_desc:
-                    cleaned_desc = russian_desc
-                    if not self.validate_abbreviation_match(abb, russian_desc):
-                        skipped_no_match += 1
-                        self.stdout.write(
-                            f"Skipping due to no letter match: {abb} - {russian_desc}"
-                        )
-                        continue
-                    if russian_desc != desc:
-                        cleaned_descriptions += 1
-                        self.stdout.write(
-                            f"Initial: {desc} -> Cleaned (Russian): {russian_desc}"
-                        )
-                    else:
-                        unchanged_descriptions += 1 
-                elif abb_lang == 'latin' and latin_desc:
-                    cleaned_desc = latin_desc
-                    if not self.validate_abbreviation_match(abb, latin_desc):
-                        skipped_no_match += 1
-                        self.stdout.write(
-                            f"Skipping due to no letter match: {abb} - {latin_desc}"
-                        )
-                        continue
-                    if latin_desc != desc:
-                        cleaned_descriptions += 1
-                        self.stdout.write(
-                            f"Initial: {desc} -> Cleaned (Latin): {latin_desc}"
-                        )
-                    else:
-                        unchanged_descriptions += 1
-                else:
-                    cleaned_desc = desc
-                    if not self.validate_abbreviation_match(abb, desc):
-                        skipped_no_match += 1
-                        self.stdout.write(
-                            f"Skipping due to no letter match: {abb} - {desc}"
-                        )
-                        continue
-                    unchanged_descriptions += 1
-                
-                cleaned_data.append([abb, cleaned_desc, contexts])
+        # Rows are written as they are cleaned, so the output is renamed into
+        # place only once the whole input has been read
+        directory = os.path.dirname(output_file) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with open(input_file, 'r', encoding='utf-8-sig') as f, \
+                    os.fdopen(fd, 'w', encoding='utf-8-sig', newline='') as out:
+                reader = csv.reader(f)
+                header = next(reader)
+                writer = csv.writer(out, quoting=csv.QUOTE_ALL)
+                writer.writerow(header)
 
-        # Save cleaned data
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.writer(f, quoting=csv.QUOTE_ALL)
-            writer.writerow(header)
-            writer.writerows(cleaned_data)
+                chunks = self.read_chunks(reader, options['chunk_size'])
+                for chunk, results in self.clean_chunks(chunks, options['workers']):
+                    for (abb, _, contexts), (outcome, cleaned_desc, message) in zip(
+                        chunk, results
+                    ):
+                        total_entries += 1
+                        counts[outcome] += 1
+                        if message:
+                            self.stdout.write(message)
+                        if cleaned_desc is not None:
+                            writer.writerow([abb, cleaned_desc, contexts])
+                            output_entries += 1
+            # mkstemp creates the file readable by the owner only
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, output_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
         self.stdout.write(self.style.SUCCESS(
             f"\nCleaning complete:\n"
             f"- Total entries in input file: {total_entries}\n"
-            f"- Mixed-language abbreviations removed: {skipped_mixed}\n"
-            f"- One-letter abbreviations removed: {skipped_one_letter}\n"
-            f"- Abbreviations without at least two capital letters removed: {skipped_few_capitals}\n"
-            f"- Entries with no matching letters removed: {skipped_no_match}\n"
-            f"- Descriptions cleaned: {cleaned_descriptions}\n"
-            f"- Descriptions unchanged: {unchanged_descriptions}\n"
-            f"- Total entries in output file: {len(cleaned_data)}\n"
+            f"- Mixed-language abbreviations removed: {counts['mixed']}\n"
+            f"- One-letter abbreviations removed: {counts['one_letter']}\n"
+            f"- Abbreviations without at least two capital letters removed: {counts['few_capitals']}\n"
+            f"- Entries with no matching letters removed: {counts['no_match']}\n"
+            f"- Descriptions cleaned: {counts['cleaned']}\n"
+            f"- Descriptions unchanged: {counts['unchanged']}\n"
+            f"- Total entries in output file: {output_entries}\n"
             f"Results saved to: {output_file}"
-        )) 
\ No newline at end of file
+        ))
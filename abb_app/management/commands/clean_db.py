@@ -1,10 +1,13 @@
 from django.core.management.base import BaseCommand
 from abb_app.models import AbbreviationEntry
+from abb_app.services.dictionary import deferred_dictionary_changes
 
 class Command(BaseCommand):
     help = "Clean abbreviation table in the database"
 
     def handle(self, *args, **kwargs):
         self.stdout.write("Clearing existing abbreviation entries...")
-        AbbreviationEntry.objects.all().delete()
+        # One index rebuild and version bump instead of one per deleted row
+        with deferred_dictionary_changes():
+            AbbreviationEntry.objects.all().delete()
         self.stdout.write(self.style.SUCCESS("Successfully cleaned abbreviation table."))
\ No newline at end of file
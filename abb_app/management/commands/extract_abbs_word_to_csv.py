@@ -1,12 +1,10 @@
 import os
-from collections import defaultdict
-from docx import Document
 import csv
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from abb_app.utils import (
-    AbbreviationTableExtractor,
-    TextProcessor
-)
+from abb_app.corpus import CorpusCache, extract_file, merge_pairs
 import time
 
 class Command(BaseCommand):
@@ -37,57 +35,113 @@ class Command(BaseCommand):
             default=50,
             help='Context window size for each abbreviation'
         )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=settings.CONTEXT_SEARCH_THREADS,
+            help='Threads searching contexts, 1 searches in a single pass'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help=(
+                'Processes extracting files in parallel; each worker searches '
+                'contexts in a single pass'
+            )
+        )
+        parser.add_argument(
+            '--cache-dir',
+            type=str,
+            default=os.path.join('abb_app', 'data', 'corpus_cache'),
+            help='Manifest and results of extracted files reused by next runs'
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Extract every file again instead of reusing cached results'
+        )
 
     def handle(self, *args, **options):
         input_dir = options['input_dir']
         output_file = options['output_file']
         max_contexts = options['max_contexts']
         context_window = options['context_window']
+        workers = options['workers']
 
         if not os.path.exists(input_dir):
             self.stderr.write(f"Input directory not found: {input_dir}")
             return
 
-        unique_pairs = defaultdict(set)
-        table_extractor = AbbreviationTableExtractor()
-        text_processor = TextProcessor()
-
-        for filename in os.listdir(input_dir):
+        corpus_start = time.time()
+        cache = CorpusCache(options['cache_dir'], context_window, max_contexts)
+        unique_pairs = {}
+        filepaths = []
+        cached_count = 0
+        for filename in sorted(os.listdir(input_dir)):
             if not filename.endswith('.docx'):
                 continue
-
             filepath = os.path.join(input_dir, filename)
-            self.stdout.write(f"\nProcessing {filename}...")
-
-            try:
-                doc = Document(filepath)
-
-                start_time = time.time()
-                abb_table = table_extractor.get_abbreviation_table(doc)
-                elapsed_time = time.time() - start_time
-                self.stdout.write(f"Abbreviation table extraction time: {elapsed_time:.2f} seconds")
+            pairs = None if options['rebuild'] else cache.lookup(filepath)
+            if pairs is None:
+                filepaths.append(filepath)
+            else:
+                merge_pairs(unique_pairs, pairs)
+                cached_count += 1
+        self.stdout.write(
+            f"Reused cached results of {cached_count} unchanged files, "
+            f"extracting {len(filepaths)} files"
+        )
+        processed_bytes = 0
 
-                start_time = time.time()
-                text = text_processor.extract_relevant_text(doc)
-                elapsed_time = time.time() - start_time
-                self.stdout.write(f"Relevant text extraction time: {elapsed_time:.2f} seconds")
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            extract = partial(
+                extract_file, window=context_window, max_contexts=max_contexts
+            )
+            results = executor.map(extract, filepaths, chunksize=4)
+        else:
+            executor = (
+                ThreadPoolExecutor(max_workers=options['threads'])
+                if options['threads'] > 1 else None
+            )
+            results = (
+                extract_file(
+                    filepath,
+                    window=context_window,
+                    max_contexts=max_contexts,
+                    executor=executor,
+                    task_count=options['threads']
+                )
+                for filepath in filepaths
+            )
 
-                start_time = time.time()
-                for abb in abb_table:
-                    contexts = text_processor.find_abbreviation_context(
-                        text, abb['abbreviation'],
-                        window=context_window,
-                        max_contexts=max_contexts
+        try:
+            for result in results:
+                self.stdout.write(f"\nProcessing {result.filename}...")
+                if result.error is not None:
+                    self.stderr.write(
+                        f"Error processing {result.filename}: {result.error}"
                     )
-                    if contexts:
-                        for desc in abb['descriptions']:
-                            key = (abb['abbreviation'], desc.strip().lower())
-                            unique_pairs[key].update(contexts)
-                elapsed_time = time.time() - start_time
-                self.stdout.write(f"Contexts collection time: {elapsed_time:.2f} seconds")
+                    continue
+
+                self.stdout.write(f"Abbreviation table and text extraction time: {result.read_time:.2f} seconds")
+                self.stdout.write(f"Contexts collection time: {result.context_time:.2f} seconds")
+                merge_pairs(unique_pairs, result.pairs)
+                cache.store(os.path.join(input_dir, result.filename), result.pairs)
+                processed_bytes += result.size
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        cache.save()
 
-            except Exception as e:
-                self.stderr.write(f"Error processing {filename}: {e}")
+        elapsed_time = time.time() - corpus_start
+        if elapsed_time > 0:
+            self.stdout.write(
+                f"\nProcessed {len(filepaths)} files in {elapsed_time:.2f} seconds "
+                f"({len(filepaths) / elapsed_time:.2f} files/s, "
+                f"{processed_bytes / 2**20 / elapsed_time:.2f} MB/s)"
+            )
 
         start_time = time.time()
         self.stdout.write(f"\nSaving results to {output_file}...")
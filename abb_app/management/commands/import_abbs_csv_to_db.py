@@ -1,7 +1,55 @@
 from django.core.management.base import BaseCommand
+from django.db import connection
 from abb_app.models import AbbreviationEntry
+from abb_app.services.abbreviations import insert_new_entries, split_new_pairs
+from abb_app.services.dictionary import (
+    bump_dictionary_version,
+    deferred_dictionary_changes,
+)
+from abb_app.services.search import rebuild_search_index
+from itertools import islice
 import csv
+import hashlib
 import os
+import time
+
+
+def pair_key(abbreviation, description):
+    """Compact fixed-size key of an (abbreviation, description) pair."""
+    return hashlib.blake2b(
+        f'{abbreviation}\0{description}'.encode('utf-8'), digest_size=16
+    ).digest()
+
+
+def chunks(items, size):
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class SkippedRecords:
+    """CSV file of skipped rows, created with the first of them."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+        self.writer = None
+
+    def writerow(self, row):
+        if self.writer is None:
+            self.file = open(self.path, 'w', encoding='utf-8', newline='')
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(['abbreviation', 'description'])
+        self.writer.writerow(row)
+
+    def writerows(self, rows):
+        for row in rows:
+            self.writerow(row)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
 
 class Command(BaseCommand):
     help = 'Import abbreviations from CSV file to database'
@@ -25,60 +73,188 @@ class Command(BaseCommand):
             action='store_true',
             help='Save skipped records to a CSV file'
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help=(
+                'Rows checked and inserted per transaction (default: 500, '
+                'at most the query parameter limit of the database)'
+            )
+        )
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help=(
+                'Make the entries with --status match the CSV: insert '
+                'missing pairs, set the status of pairs that have another '
+                'one and delete entries with --status absent from the CSV, '
+                'in one transaction'
+            )
+        )
 
     def handle(self, *args, **options):
         csv_file = options['csv_file']
         status = options['status']
         save_skipped = options['save_skipped']
+        batch_size = options['batch_size']
 
         if not os.path.exists(csv_file):
             self.stdout.write(self.style.ERROR(f'File {csv_file} does not exist'))
             return
 
-        skipped_records = []
-        imported = 0
+        # A batch is looked up with one parameter per abbreviation
+        max_batch_size = connection.features.max_query_params
+        if not 0 < batch_size <= max_batch_size:
+            self.stdout.write(self.style.ERROR(
+                f'--batch-size must be between 1 and {max_batch_size}'
+            ))
+            return
 
-        with open(csv_file, 'r', encoding='utf-8-sig') as f:
-            reader = csv.reader(f)
-            next(reader)  # Skip header row
-            
-            for row in reader:
-                if len(row) < 2:
-                    skipped_records.append(row)
-                    continue
-                    
-                abbreviation, description = row[0], row[1]
-                
-                # Check if this combination already exists
-                if not AbbreviationEntry.objects.filter(
-                    abbreviation=abbreviation,
-                    description=description
-                ).exists():
-                    # Create new entry
-                    AbbreviationEntry.objects.create(
-                        abbreviation=abbreviation,
-                        description=description,
-                        status=status
+        skipped_file = 'skipped_records.csv'
+        skipped_writer = SkippedRecords(skipped_file) if save_skipped else None
+
+        start = time.perf_counter()
+        try:
+            with open(csv_file, 'r', encoding='utf-8-sig') as f:
+                reader = csv.reader(f)
+                next(reader)  # Skip header row
+
+                if options['sync']:
+                    total, skipped = self.sync_rows(
+                        reader, status, batch_size, skipped_writer
                     )
-                    imported += 1
                 else:
-                    skipped_records.append(row)
+                    total, skipped = self.import_rows(
+                        reader, status, batch_size, skipped_writer
+                    )
+        finally:
+            if skipped_writer:
+                skipped_writer.close()
+
+        elapsed = time.perf_counter() - start
+        rate = total / elapsed if elapsed else 0
+        self.stdout.write(
+            f'Processed {total} rows in {elapsed:.2f}s '
+            f'({rate:.0f} rows/s)'
+        )
 
+        if skipped_writer and skipped_writer.file is not None:
             self.stdout.write(
-                self.style.SUCCESS(
-                    f'Successfully imported {imported} entries '
-                    f'(skipped {len(skipped_records)} duplicates)'
+                self.style.WARNING(f'Skipped records saved to {skipped_file}')
+            )
+
+    def import_rows(self, reader, status, batch_size, skipped_writer):
+        imported = 0
+        skipped = 0
+        total = 0
+        while True:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                break
+            total += len(rows)
+
+            new_entries, skipped_rows = self.split_batch(rows, status)
+            inserted = insert_new_entries(new_entries)
+            imported += inserted
+            # Entries inserted by someone else meanwhile are duplicates too
+            skipped += len(skipped_rows) + len(new_entries) - inserted
+            if skipped_writer:
+                skipped_writer.writerows(skipped_rows)
+
+        if imported and status == 'approved':
+            # bulk_create sends no signals
+            rebuild_search_index()
+            bump_dictionary_version()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully imported {imported} entries '
+                f'(skipped {skipped} duplicates)'
+            )
+        )
+        return total, skipped
+
+    def sync_rows(self, reader, status, batch_size, skipped_writer):
+        """
+        Applies the minimal changeset between the CSV and the database.
+        Pairs are compared by hashed keys, so only the keys of the database
+        and the CSV are held in memory.
+        """
+        existing = {
+            pair_key(abbreviation, description): (pk, entry_status)
+            for pk, abbreviation, description, entry_status
+            in AbbreviationEntry.objects.values_list(
+                'pk', 'abbreviation', 'description', 'status'
+            ).iterator()
+        }
+
+        seen = set()
+        new_entries = []
+        status_changes = []
+        skipped = 0
+        total = 0
+        for row in reader:
+            total += 1
+            key = pair_key(row[0], row[1]) if len(row) >= 2 else None
+            if key is None or key in seen:
+                skipped += 1
+                if skipped_writer:
+                    skipped_writer.writerow(row)
+                continue
+
+            seen.add(key)
+            if key not in existing:
+                new_entries.append(AbbreviationEntry(
+                    abbreviation=row[0],
+                    description=row[1],
+                    status=status
+                ))
+            elif existing[key][1] != status:
+                status_changes.append(existing[key][0])
+
+        deletions = [
+            pk for key, (pk, entry_status) in existing.items()
+            if entry_status == status and key not in seen
+        ]
+
+        if new_entries or status_changes or deletions:
+            with deferred_dictionary_changes():
+                AbbreviationEntry.objects.bulk_create(
+                    new_entries, batch_size=batch_size
                 )
+                for pks in chunks(status_changes, batch_size):
+                    AbbreviationEntry.objects.filter(pk__in=pks).update(
+                        status=status
+                    )
+                for pks in chunks(deletions, batch_size):
+                    AbbreviationEntry.objects.filter(pk__in=pks).delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Synced {status} entries: inserted {len(new_entries)}, '
+                f'status changed {len(status_changes)}, '
+                f'deleted {len(deletions)} '
+                f'(skipped {skipped} duplicates)'
             )
+        )
+        return total, skipped
 
-            # Save skipped records to a CSV file if requested
-            if skipped_records and save_skipped:
-                skipped_file = 'skipped_records.csv'
-                with open(skipped_file, 'w', encoding='utf-8', newline='') as skipped_f:
-                    writer = csv.writer(skipped_f)
-                    writer.writerow(['abbreviation', 'description'])
-                    writer.writerows(skipped_records)
-
-                self.stdout.write(
-                    self.style.WARNING(f'Skipped records saved to {skipped_file}')
-                )
\ No newline at end of file
+    def split_batch(self, rows, status):
+        """
+        Splits a batch into new entries and skipped rows: malformed ones,
+        pairs already in the database and repeats within the batch.
+        """
+        malformed = [row for row in rows if len(row) < 2]
+        new_pairs, duplicates = split_new_pairs(
+            [(row[0], row[1]) for row in rows if len(row) >= 2]
+        )
+        new_entries = [
+            AbbreviationEntry(
+                abbreviation=abbreviation,
+                description=description,
+                status=status
+            )
+            for abbreviation, description in new_pairs
+        ]
+        return new_entries, malformed + [list(pair) for pair in duplicates]
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from abb_app.services.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        'Recreate the full-text search table of approved entries. It is '
+        'also rebuilt after every migrate.'
+    )
+
+    def handle(self, *args, **options):
+        rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
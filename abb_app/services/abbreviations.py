@@ -1,7 +1,11 @@
-from typing import Dict, List, Optional
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils.timezone import now
 
 from abb_app.models import AbbreviationEntry
-from abb_app.utils import Abbreviation
+from abb_app.utils import Abbreviation, DescriptionIndex
 
 
 def load_approved_dictionary() -> List[Abbreviation]:
@@ -24,6 +28,89 @@ def load_approved_dictionary() -> List[Abbreviation]:
     ]
 
 
+def load_dictionary_statistics() -> Dict[str, Any]:
+    abbreviations = AbbreviationEntry.objects.filter(status='approved')
+
+    last_month = now() - timedelta(days=30)
+    last_entry = abbreviations.order_by('-created_at').first()
+    return {
+        'total_count': abbreviations.count(),
+        'new_count': abbreviations.filter(created_at__gte=last_month).count(),
+        'last_update': last_entry.created_at if last_entry else None,
+    }
+
+
+def load_existing_descriptions(after_id: int = 0) -> List[Tuple[int, str, str]]:
+    """
+    Approved and submitted descriptions with their entry ids, rejected ones
+    excluded, of the entries added after `after_id`.
+    """
+    return list(
+        AbbreviationEntry.objects.exclude(
+            status='rejected'
+        ).filter(
+            id__gt=after_id
+        ).order_by('id').values_list('id', 'abbreviation', 'description')
+    )
+
+
+def split_new_pairs(
+    pairs: List[Tuple[str, str]],
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Splits (abbreviation, description) pairs into new ones and duplicates:
+    pairs already in the database and repeats within `pairs`. Existing
+    pairs are fetched in one query for the whole batch.
+    """
+    seen = set(
+        AbbreviationEntry.objects.filter(
+            abbreviation__in={abbreviation for abbreviation, _ in pairs}
+        ).values_list('abbreviation', 'description')
+    )
+
+    new_pairs = []
+    duplicates = []
+    for pair in pairs:
+        if pair in seen:
+            duplicates.append(pair)
+            continue
+        seen.add(pair)
+        new_pairs.append(pair)
+    return new_pairs, duplicates
+
+
+def insert_new_entries(entries: List[AbbreviationEntry]) -> int:
+    """
+    Bulk-inserts entries in one transaction and returns the number of rows
+    inserted. Pairs added since they were checked are skipped by the
+    unique constraint, so the rows of the batch's abbreviations are counted
+    instead of the entries, through the abbreviation index.
+    """
+    batch_rows = AbbreviationEntry.objects.filter(
+        abbreviation__in={entry.abbreviation for entry in entries}
+    )
+    with transaction.atomic():
+        count = batch_rows.count()
+        AbbreviationEntry.objects.bulk_create(entries, ignore_conflicts=True)
+        return batch_rows.count() - count
+
+
+def find_abbreviation(
+    doc_abbs: List[Abbreviation],
+    abbreviation: str,
+) -> Abbreviation:
+    entry = next(
+        (
+            item for item in doc_abbs
+            if item['abbreviation'] == abbreviation
+        ),
+        None,
+    )
+    if entry is None:
+        raise ValueError('Abbreviation not found')
+    return entry
+
+
 def get_selected_abbreviations(
     doc_abbs: List[Abbreviation],
 ) -> List[Dict[str, str]]:
@@ -42,16 +129,9 @@ def update_abbreviation_selection(
     abbreviation: str,
     description: Optional[str],
     action: str,
+    description_index: Optional[DescriptionIndex] = None,
 ) -> None:
-    entry = next(
-        (
-            item for item in doc_abbs
-            if item['abbreviation'] == abbreviation
-        ),
-        None,
-    )
-    if entry is None:
-        raise ValueError('Abbreviation not found')
+    entry = find_abbreviation(doc_abbs, abbreviation)
 
     if action == 'skip':
         entry['selected_description'] = None
@@ -66,8 +146,15 @@ def update_abbreviation_selection(
     if description in entry['descriptions']:
         return
 
+    abbreviation = entry.get('correct_form') or abbreviation
+    if (
+        description_index is not None
+        and description_index.find_duplicate(abbreviation, description)
+    ):
+        return
+
     AbbreviationEntry.objects.get_or_create(
-        abbreviation=entry.get('correct_form') or abbreviation,
+        abbreviation=abbreviation,
         description=description,
         defaults={
             'status': 'for_review',
@@ -0,0 +1,267 @@
+import os
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.timezone import now
+
+from abb_app.dictionary_snapshot import (
+    DictionarySnapshot,
+    open_snapshot,
+    write_snapshot,
+)
+from abb_app.utils import AbbreviationDictionary, DescriptionIndex
+
+from .abbreviations import (
+    load_approved_dictionary,
+    load_dictionary_statistics,
+    load_existing_descriptions,
+)
+from .search import rebuild_search_index
+
+Dictionary = Union[AbbreviationDictionary, DictionarySnapshot]
+
+# Cached data is keyed by the day stamp, so it is useless after a day
+CACHE_TIMEOUT = 24 * 60 * 60
+
+_lock = threading.Lock()
+_deferred = threading.local()
+_cached: Optional[Tuple[tuple, Dictionary]] = None
+_description_index: Optional[Tuple[str, int, DescriptionIndex]] = None
+
+
+def get_dictionary_version() -> str:
+    """Version stamp shared by worker processes, empty before the first bump."""
+    try:
+        with open(settings.DICTIONARY_VERSION_FILE, encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return ''
+
+
+def bump_dictionary_version() -> str:
+    """Replaces the version stamp atomically, so readers never see it torn."""
+    directory = os.path.dirname(settings.DICTIONARY_VERSION_FILE)
+    os.makedirs(directory, exist_ok=True)
+
+    version = uuid.uuid4().hex
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.version-')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(version)
+        os.replace(tmp_path, settings.DICTIONARY_VERSION_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return version
+
+
+def schedule_dictionary_version_bump() -> None:
+    """
+    Bumps the version once the current transaction is committed. A snapshot
+    in use is rebuilt later, by the first process needing the dictionary.
+    """
+    transaction.on_commit(bump_dictionary_version)
+
+
+def changes_deferred() -> bool:
+    """True inside `deferred_dictionary_changes`, signals skip their work."""
+    return getattr(_deferred, 'active', False)
+
+
+@contextmanager
+def deferred_dictionary_changes() -> Iterator[None]:
+    """
+    Runs bulk entry changes in one transaction. The search table is rebuilt
+    and the version bumped once, instead of once per saved or deleted entry.
+    """
+    _deferred.active = True
+    try:
+        with transaction.atomic():
+            yield
+            rebuild_search_index()
+            schedule_dictionary_version_bump()
+    finally:
+        _deferred.active = False
+
+
+def get_approved_dictionary() -> Dictionary:
+    """
+    Returns the approved dictionary, reloaded only when the version stamp
+    or the snapshot file changes. The snapshot is used when it was built
+    from the current version. An outdated snapshot is rebuilt by one
+    process, the others load the dictionary from the database meanwhile.
+
+    Inside a transaction the database may hold uncommitted changes, so the
+    dictionary is loaded bypassing the cache.
+    """
+    global _cached
+    if transaction.get_connection().in_atomic_block:
+        return AbbreviationDictionary(load_approved_dictionary())
+
+    version = get_dictionary_version()
+    with _lock:
+        key = (version, _snapshot_stamp())
+        if _cached is None or _cached[0] != key:
+            snapshot = open_snapshot(settings.DICTIONARY_SNAPSHOT_FILE, version)
+            if (
+                snapshot is None
+                and key[1] is not None
+                and _update_snapshot(version)
+            ):
+                key = (version, _snapshot_stamp())
+                snapshot = open_snapshot(
+                    settings.DICTIONARY_SNAPSHOT_FILE, version
+                )
+            _cached = (key, snapshot or AbbreviationDictionary(
+                load_approved_dictionary()
+            ))
+        return _cached[1]
+
+
+def get_description_index() -> DescriptionIndex:
+    """
+    Descriptions of approved and submitted entries. The index is rebuilt
+    when the version stamp changes. Submissions do not bump the version,
+    so entries added since the last lookup are fetched by id, a range query
+    on the primary key that is usually empty. Submissions rejected or
+    deleted in between stay in the index until the next bump.
+    """
+    global _description_index
+    if transaction.get_connection().in_atomic_block:
+        return DescriptionIndex(
+            (abbreviation, description)
+            for _, abbreviation, description in load_existing_descriptions()
+        )
+
+    version = get_dictionary_version()
+    with _lock:
+        if (
+            _description_index is None
+            or _description_index[0] != version
+        ):
+            _description_index = (version, 0, DescriptionIndex())
+        _, last_id, index = _description_index
+        for entry_id, abbreviation, description in load_existing_descriptions(
+            last_id
+        ):
+            index.add(abbreviation, description)
+            last_id = entry_id
+        _description_index = (version, last_id, index)
+        return index
+
+
+def get_dictionary_stamp() -> Optional[str]:
+    """
+    Stamp of what the dictionary page shows: the version and the current
+    day, as the count of entries added in the last month changes daily.
+    None when the state cannot be stamped, before the first bump or inside
+    a transaction.
+    """
+    if transaction.get_connection().in_atomic_block:
+        return None
+    version = get_dictionary_version()
+    if not version:
+        return None
+    return f'{version}-{now().date().isoformat()}'
+
+
+def get_dictionary_modified() -> Optional[datetime]:
+    """Time of the last version bump, at least the start of the day."""
+    try:
+        mtime = os.stat(settings.DICTIONARY_VERSION_FILE).st_mtime
+    except FileNotFoundError:
+        return None
+    modified = datetime.fromtimestamp(mtime, tz=timezone.utc)
+    day_start = now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(modified, day_start)
+
+
+def get_dictionary_statistics() -> Dict[str, Any]:
+    """Statistics of the dictionary page, cached per stamp."""
+    stamp = get_dictionary_stamp()
+    if stamp is None:
+        return load_dictionary_statistics()
+
+    key = f'dictionary-statistics:{stamp}'
+    statistics = cache.get(key)
+    if statistics is None:
+        statistics = load_dictionary_statistics()
+        cache.set(key, statistics, CACHE_TIMEOUT)
+    return statistics
+
+
+def build_dictionary_snapshot() -> str:
+    """Compiles the approved dictionary into the snapshot file."""
+    with _snapshot_lock():
+        # Read before loading, a later change makes the snapshot outdated
+        version = get_dictionary_version() or bump_dictionary_version()
+        write_snapshot(
+            settings.DICTIONARY_SNAPSHOT_FILE,
+            load_approved_dictionary(),
+            version,
+        )
+    return version
+
+
+def _update_snapshot(version: str) -> bool:
+    """
+    Rebuilds an outdated snapshot from `version`, unless another process is
+    rebuilding it. True when the snapshot holds `version` afterwards.
+    """
+    with _snapshot_lock(blocking=False) as locked:
+        if not locked or not version:
+            return False
+        # Rebuilt by the previous holder, or already outdated again
+        if open_snapshot(settings.DICTIONARY_SNAPSHOT_FILE, version):
+            return True
+        if get_dictionary_version() != version:
+            return False
+        write_snapshot(
+            settings.DICTIONARY_SNAPSHOT_FILE,
+            load_approved_dictionary(),
+            version,
+        )
+        return True
+
+
+@contextmanager
+def _snapshot_lock(blocking: bool = True) -> Iterator[bool]:
+    """
+    Lock file serializing snapshot rebuilds between processes, so an older
+    version never replaces a newer one. Yields False if `blocking` is off
+    and the lock is held. Without fcntl rebuilds are not serialized; an
+    outdated snapshot is still never used, only rebuilt again.
+    """
+    if fcntl is None:
+        yield True
+        return
+
+    lock_path = f'{settings.DICTIONARY_SNAPSHOT_FILE}.lock'
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, 'a') as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        yield True
+
+
+def _snapshot_stamp() -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(settings.DICTIONARY_SNAPSHOT_FILE)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
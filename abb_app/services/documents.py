@@ -1,22 +1,38 @@
 import io
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from docx import Document
+from django.conf import settings
 
+from abb_app.docx_reader import DocxReader
 from abb_app.utils import (
     Abbreviation,
     AbbreviationFormatter,
-    AbbreviationTableExtractor,
     AbbreviationTableGenerator,
+    TextProcessor,
     process_abbreviations,
 )
 
-from .abbreviations import load_approved_dictionary
-extractor = AbbreviationTableExtractor()
+from .dictionary import get_approved_dictionary
+text_processor = TextProcessor()
 formatter = AbbreviationFormatter()
 generator = AbbreviationTableGenerator()
 
+_extraction_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_extraction_executor() -> Optional[ProcessPoolExecutor]:
+    """Process pool shared by requests, created on first use."""
+    global _extraction_executor
+    if settings.EXTRACTION_WORKERS <= 1:
+        return None
+    if _extraction_executor is None:
+        _extraction_executor = ProcessPoolExecutor(
+            max_workers=settings.EXTRACTION_WORKERS
+        )
+    return _extraction_executor
+
 
 @dataclass(frozen=True)
 class ProcessedDocument:
@@ -25,11 +41,22 @@ class ProcessedDocument:
 
 
 def process_document(file_path: str) -> ProcessedDocument:
-    dictionary = load_approved_dictionary()
+    dictionary = get_approved_dictionary()
 
-    document = Document(file_path)
-    initial_abbreviations = extractor.get_abbreviation_table(document)
-    abbreviations = process_abbreviations(document, dictionary)
+    document = DocxReader(file_path)
+    initial_abbreviations, text = text_processor.read_document(document)
+    abbreviations = process_abbreviations(
+        document,
+        dictionary,
+        text=text,
+        # The pool is only started by a document long enough to be split
+        executor=(
+            get_extraction_executor()
+            if len(text) >= settings.PARALLEL_EXTRACTION_MIN_CHARS else None
+        ),
+        shard_count=settings.EXTRACTION_WORKERS,
+        min_sharded_length=settings.PARALLEL_EXTRACTION_MIN_CHARS,
+    )
 
     return ProcessedDocument(
         abbreviations=abbreviations,
@@ -0,0 +1,188 @@
+import base64
+import json
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from abb_app.models import AbbreviationEntry
+
+
+SEARCH_TABLE = 'abb_app_abbreviationentry_fts'
+PAGE_SIZE = 50
+PAGE_SIZES = (25, 50, 100)
+ORDER_FIELDS = ('abbreviation', 'description', 'updated_at')
+# The trigram tokenizer can't match shorter terms
+MIN_MATCH_LENGTH = 3
+
+Cursor = Tuple[str, int]
+
+
+def ensure_search_index() -> None:
+    """
+    Creates the FTS5 table of approved entries, filled from the database,
+    unless it already exists. The app has no migrations, so the table is
+    created after `migrate` and by the `rebuild_search_index` command,
+    never while serving requests.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+            [SEARCH_TABLE],
+        )
+        if cursor.fetchone():
+            return
+
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE {SEARCH_TABLE} USING fts5('
+            "abbreviation, description, tokenize = 'trigram')"
+        )
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, abbreviation, description) '
+            f'SELECT id, abbreviation, description '
+            f'FROM {AbbreviationEntry._meta.db_table} '
+            "WHERE status = 'approved'"
+        )
+
+
+def rebuild_search_index() -> None:
+    """Refills the search table, for writes that send no signals."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+    ensure_search_index()
+
+
+def index_entries(entries: Iterable[AbbreviationEntry]) -> None:
+    """Adds approved entries to the search table, removes the others."""
+    with connection.cursor() as cursor:
+        for entry in entries:
+            cursor.execute(
+                f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [entry.pk]
+            )
+            if entry.status == 'approved':
+                cursor.execute(
+                    f'INSERT INTO {SEARCH_TABLE} '
+                    '(rowid, abbreviation, description) VALUES (%s, %s, %s)',
+                    [entry.pk, entry.abbreviation, entry.description],
+                )
+
+
+def unindex_entry(entry_id: int) -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [entry_id]
+        )
+
+
+def build_match_query(abbreviation: str = '', description: str = '') -> str:
+    """
+    FTS5 query matching entries whose columns contain every term of the
+    given filters, anywhere in the text. Terms shorter than three
+    characters are left to `build_short_term_filter`.
+    """
+    terms = []
+    for column, text in (
+        ('abbreviation', abbreviation),
+        ('description', description),
+    ):
+        for term in text.split():
+            if len(term) >= MIN_MATCH_LENGTH:
+                phrase = term.replace('"', '""')
+                terms.append(f'{column} : "{phrase}"')
+    return ' AND '.join(terms)
+
+
+def build_short_term_filter(abbreviation: str = '', description: str = '') -> Q:
+    """
+    LIKE filter of the terms too short for the trigram index. LIKE of
+    SQLite ignores the case of ASCII letters only, so the cased forms of
+    a term are matched too.
+    """
+    condition = Q()
+    for column, text in (
+        ('abbreviation', abbreviation),
+        ('description', description),
+    ):
+        for term in text.split():
+            if len(term) >= MIN_MATCH_LENGTH:
+                continue
+            forms = Q()
+            for form in {term, term.lower(), term.upper(), term.capitalize()}:
+                forms |= Q(**{f'{column}__contains': form})
+            condition &= forms
+    return condition
+
+
+def search_entries(
+    abbreviation: str = '',
+    description: str = '',
+    after: Optional[Cursor] = None,
+    limit: int = PAGE_SIZE,
+    order: str = 'abbreviation',
+) -> Tuple[List[AbbreviationEntry], Optional[Cursor]]:
+    """
+    Page of approved entries sorted by `order`, one of `ORDER_FIELDS`
+    with an optional '-' for descending order, starting after the `after`
+    cursor, and the cursor of the next page.
+
+    Keyset pagination continues from the sort value and id of the last
+    entry, so a page costs the same wherever it is in the dictionary.
+    """
+    descending = order.startswith('-')
+    field = order.lstrip('-')
+    if field not in ORDER_FIELDS:
+        raise ValueError('Invalid order')
+
+    entries = AbbreviationEntry.objects.filter(
+        build_short_term_filter(abbreviation, description),
+        status='approved',
+    )
+    query = build_match_query(abbreviation, description)
+    if query:
+        entries = entries.filter(id__in=RawSQL(
+            f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s',
+            (query,),
+        ))
+    if after is not None:
+        value, entry_id = after
+        if field == 'updated_at':
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                raise ValueError('Invalid cursor')
+        lookup = 'lt' if descending else 'gt'
+        entries = entries.filter(
+            Q(**{f'{field}__{lookup}': value})
+            | Q(**{field: value, f'id__{lookup}': entry_id})
+        )
+
+    entries = entries.order_by(order, '-id' if descending else 'id')
+    page = list(entries[:limit + 1])
+    if len(page) <= limit:
+        return page, None
+    last = page[limit - 1]
+    value = getattr(last, field)
+    if field == 'updated_at':
+        value = value.isoformat()
+    return page[:limit], (value, last.pk)
+
+
+def encode_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    if cursor is None:
+        return None
+    data = json.dumps(cursor, ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(data).decode('ascii')
+
+
+def decode_cursor(value: Optional[str]) -> Optional[Cursor]:
+    if not value:
+        return None
+    try:
+        sort_value, entry_id = json.loads(base64.urlsafe_b64decode(value))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(sort_value, str) or not isinstance(entry_id, int):
+        raise ValueError('Invalid cursor')
+    return sort_value, entry_id
@@ -0,0 +1,53 @@
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from abb_app.models import AbbreviationEntry
+from abb_app.services.dictionary import (
+    changes_deferred,
+    schedule_dictionary_version_bump,
+)
+from abb_app.services.search import (
+    index_entries,
+    rebuild_search_index,
+    unindex_entry,
+)
+
+
+@receiver(pre_save, sender=AbbreviationEntry)
+def remember_status(sender, instance: AbbreviationEntry, **kwargs) -> None:
+    """Keeps the stored status, saving can move an entry out of approved."""
+    if changes_deferred() or instance.pk is None:
+        instance._previous_status = None
+        return
+    instance._previous_status = AbbreviationEntry.objects.filter(
+        pk=instance.pk
+    ).values_list('status', flat=True).first()
+
+
+@receiver(post_save, sender=AbbreviationEntry)
+def entry_saved(sender, instance: AbbreviationEntry, **kwargs) -> None:
+    if changes_deferred():
+        return
+    index_entries([instance])
+    # Submitted and rejected entries are not part of the dictionary
+    if 'approved' in (instance.status, instance._previous_status):
+        schedule_dictionary_version_bump()
+
+
+@receiver(post_delete, sender=AbbreviationEntry)
+def entry_deleted(sender, instance: AbbreviationEntry, **kwargs) -> None:
+    if changes_deferred():
+        return
+    unindex_entry(instance.pk)
+    if instance.status == 'approved':
+        schedule_dictionary_version_bump()
+
+
+def create_search_index(sender, using: str, **kwargs) -> None:
+    """
+    The app has no migrations, so the search table is rebuilt after every
+    `migrate`, which also picks up a changed tokenizer.
+    """
+    if using == DEFAULT_DB_ALIAS:
+        rebuild_search_index()
@@ -0,0 +1,113 @@
+const dictionaryTable = document.getElementById('dictionary-table');
+const dictionaryBody = dictionaryTable.querySelector('tbody');
+const dictionaryMore = document.getElementById('dictionary-more');
+const dictionaryFilters = dictionaryTable.querySelectorAll(
+    '.filter-group input'
+);
+const dictionaryHeaders = dictionaryTable.querySelectorAll('th[data-order]');
+const dictionaryLength = document.getElementById('dictionary-length');
+
+const dictionaryFilterDelayMs = 300;
+let dictionaryFilterTimer = null;
+let nextCursor = dictionaryTable.dataset.nextCursor;
+let dictionaryRequest = 0;
+let dictionaryOrder = 'abbreviation';
+
+function createDictionaryRow(entry) {
+    const row = document.createElement('tr');
+    for (const value of [
+        entry.abbreviation,
+        entry.description,
+        entry.updated_at
+    ]) {
+        const cell = document.createElement('td');
+        cell.textContent = value;
+        row.appendChild(cell);
+    }
+
+    const editCell = document.createElement('td');
+    const editButton = document.createElement('button');
+    editButton.className = 'edit-button';
+    editButton.setAttribute('onclick', `openSuggestForm('${entry.id}')`);
+    editButton.innerHTML = '<span class="material-icons">edit</span>';
+    editCell.appendChild(editButton);
+    row.appendChild(editCell);
+    return row;
+}
+
+function createEmptyRow() {
+    const row = document.createElement('tr');
+    const cell = document.createElement('td');
+    cell.colSpan = 4;
+    cell.className = 'no-entries';
+    cell.textContent = 'Ничего не найдено';
+    row.appendChild(cell);
+    return row;
+}
+
+async function loadDictionaryEntries(reset) {
+    const params = new URLSearchParams();
+    dictionaryFilters.forEach(input => {
+        params.set(input.name, input.value.trim());
+    });
+    params.set('order', dictionaryOrder);
+    params.set('limit', dictionaryLength.value);
+    if (!reset && nextCursor) {
+        params.set('cursor', nextCursor);
+    }
+
+    // Responses of outdated filters are dropped
+    const request = ++dictionaryRequest;
+    try {
+        const response = await fetch(
+            `${dictionaryTable.dataset.entriesUrl}?${params}`
+        );
+        const data = await response.json();
+        if (request !== dictionaryRequest) return;
+        if (!data.success) {
+            throw new Error(data.error || 'Failed to load entries');
+        }
+
+        const rows = data.entries.map(createDictionaryRow);
+        if (reset) {
+            dictionaryBody.replaceChildren(
+                ...(rows.length ? rows : [createEmptyRow()])
+            );
+        } else {
+            dictionaryBody.append(...rows);
+        }
+        nextCursor = data.next_cursor;
+        dictionaryMore.hidden = !nextCursor;
+    } catch (error) {
+        console.error('Dictionary loading failed:', error);
+    }
+}
+
+dictionaryFilters.forEach(input => {
+    input.addEventListener('input', () => {
+        clearTimeout(dictionaryFilterTimer);
+        dictionaryFilterTimer = setTimeout(
+            () => loadDictionaryEntries(true),
+            dictionaryFilterDelayMs
+        );
+    });
+});
+
+// Sorting is done by the server, a second click reverses the order
+dictionaryHeaders.forEach(header => {
+    header.addEventListener('click', () => {
+        const field = header.dataset.order;
+        dictionaryOrder = dictionaryOrder === field ? `-${field}` : field;
+        dictionaryHeaders.forEach(other => {
+            other.classList.remove('sorting_asc', 'sorting_desc');
+        });
+        header.classList.add(
+            dictionaryOrder.startsWith('-') ? 'sorting_desc' : 'sorting_asc'
+        );
+        loadDictionaryEntries(true);
+    });
+});
+
+dictionaryLength.addEventListener('change', () => loadDictionaryEntries(true));
+
+dictionaryMore.addEventListener('click', () => loadDictionaryEntries(false));
@@ -4,7 +4,8 @@ const processingUrls = {
     update: processingConfig.dataset.updateUrl,
     difference: processingConfig.dataset.differenceUrl,
     export: processingConfig.dataset.exportUrl,
-    generate: processingConfig.dataset.generateUrl
+    generate: processingConfig.dataset.generateUrl,
+    similar: processingConfig.dataset.similarUrl
 };
 
 let compareWithExisting =
@@ -191,6 +192,34 @@ async function generateAbbreviationTable() {
     }
 }
 
+const similarDescriptionsDelayMs = 300;
+const similarDescriptionsTimers = new WeakMap();
+
+async function showSimilarDescriptions(item, description) {
+    const container = item.querySelector('.similar-descriptions');
+    const params = new URLSearchParams({
+        abbreviation: item.dataset.abbreviation,
+        description
+    });
+
+    try {
+        const response = await fetch(`${processingUrls.similar}?${params}`);
+        const data = await response.json();
+        if (!data.success) return;
+
+        container.replaceChildren(...data.similar.map(similar => {
+            const button = document.createElement('button');
+            button.className = 'btn-select-option';
+            button.dataset.processingAction = 'select-description';
+            button.dataset.description = similar;
+            button.textContent = `Уже есть: ${similar}`;
+            return button;
+        }));
+    } catch (error) {
+        console.error('Similar descriptions lookup failed:', error);
+    }
+}
+
 let pendingGeneration = null;
 
 function openGenerationConsent(button, item) {
@@ -320,6 +349,18 @@ document.addEventListener('click', event => {
     }
 });
 
+document.addEventListener('input', event => {
+    const input = event.target.closest('.input-group input[type="text"]');
+    if (!input) return;
+
+    const item = input.closest('.abbreviation-item');
+    clearTimeout(similarDescriptionsTimers.get(item));
+    similarDescriptionsTimers.set(item, setTimeout(
+        () => showSimilarDescriptions(item, input.value.trim()),
+        similarDescriptionsDelayMs
+    ));
+});
+
 document.addEventListener('DOMContentLoaded', () => {
     const consentDialog = document.getElementById('llm-consent-dialog');
     consentDialog.addEventListener('cancel', () => {
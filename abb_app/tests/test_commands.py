@@ -0,0 +1,450 @@
+import csv
+import os
+import stat
+from contextlib import chdir
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from docx import Document
+
+from abb_app.models import AbbreviationEntry
+from abb_app.services.search import search_entries
+
+
+class ImportCsvCommandTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        settings = override_settings(
+            DICTIONARY_VERSION_FILE=str(Path(self.tmp_dir.name) / 'version'),
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def write_csv(self, rows):
+        path = Path(self.tmp_dir.name) / 'dictionary.csv'
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['abbreviation', 'description'])
+            writer.writerows(rows)
+        return str(path)
+
+    def test_rows_are_deduplicated_across_batches_and_database(self):
+        AbbreviationEntry.objects.create(
+            abbreviation='T4', description='thyroxine', status='approved'
+        )
+        path = self.write_csv([
+            ['T4', 'thyroxine'],
+            ['T3', 'triiodothyronine'],
+            ['T3', 'triiodothyronine'],
+            ['TSH'],
+            ['АЛТ', 'аланинаминотрансфераза'],
+            ['T3', 'triiodothyronine'],
+        ])
+        out = StringIO()
+
+        call_command(
+            'import_abbs_csv_to_db', csv_file=path, status='approved',
+            batch_size=2, stdout=out,
+        )
+
+        self.assertIn('imported 2 entries (skipped 4 duplicates)', out.getvalue())
+        self.assertIn('rows/s', out.getvalue())
+        self.assertEqual(
+            sorted(AbbreviationEntry.objects.values_list(
+                'abbreviation', flat=True
+            )),
+            ['T3', 'T4', 'АЛТ'],
+        )
+        entries, _ = search_entries(description='аланин')
+        self.assertEqual([entry.abbreviation for entry in entries], ['АЛТ'])
+
+    def test_only_inserted_rows_are_counted(self):
+        AbbreviationEntry.objects.create(
+            abbreviation='T4', description='thyroxine'
+        )
+        AbbreviationEntry.objects.create(
+            abbreviation='TSH', description='thyrotropin'
+        )
+        path = self.write_csv([['T4', 'thyroxine'], ['T3', 'triiodothyronine']])
+        out = StringIO()
+
+        # T4 looks new, as if it was inserted after the batch was checked
+        with mock.patch(
+            'abb_app.management.commands.import_abbs_csv_to_db.split_new_pairs',
+            return_value=(
+                [('T4', 'thyroxine'), ('T3', 'triiodothyronine')], []
+            ),
+        ):
+            call_command('import_abbs_csv_to_db', csv_file=path, stdout=out)
+
+        self.assertIn('imported 1 entries (skipped 1 duplicates)', out.getvalue())
+
+    def test_skipped_records_file_is_created_only_for_skipped_rows(self):
+        skipped_file = Path(self.tmp_dir.name) / 'skipped_records.csv'
+
+        with chdir(self.tmp_dir.name):
+            call_command(
+                'import_abbs_csv_to_db', csv_file=self.write_csv([['T4', 't']]),
+                save_skipped=True, stdout=StringIO(),
+            )
+            self.assertFalse(skipped_file.exists())
+
+            call_command(
+                'import_abbs_csv_to_db', csv_file=self.write_csv([['T4', 't']]),
+                save_skipped=True, stdout=StringIO(),
+            )
+        with open(skipped_file, encoding='utf-8') as f:
+            self.assertEqual(
+                f.read().splitlines(), ['abbreviation,description', 'T4,t']
+            )
+
+    def test_batch_size_is_limited_by_query_parameters(self):
+        out = StringIO()
+
+        call_command(
+            'import_abbs_csv_to_db', csv_file=self.write_csv([['T4', 't']]),
+            batch_size=100000, stdout=out,
+        )
+
+        self.assertIn('--batch-size must be between 1 and', out.getvalue())
+        self.assertFalse(AbbreviationEntry.objects.exists())
+
+    def test_sync_applies_only_the_changeset(self):
+        for abbreviation, description, status in [
+            ('T4', 'thyroxine', 'approved'),
+            ('T3', 'triiodothyronine', 'for_review'),
+            ('ТТГ', 'тиреотропный гормон', 'approved'),
+            ('ALT', 'alanine', 'for_review'),
+        ]:
+            AbbreviationEntry.objects.create(
+                abbreviation=abbreviation,
+                description=description,
+                status=status,
+            )
+        unchanged = AbbreviationEntry.objects.get(abbreviation='T4')
+        path = self.write_csv([
+            ['T4', 'thyroxine'],
+            ['T3', 'triiodothyronine'],
+            ['АЛТ', 'аланинаминотрансфераза'],
+        ])
+        out = StringIO()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            call_command(
+                'import_abbs_csv_to_db', csv_file=path, status='approved',
+                sync=True, stdout=out,
+            )
+
+        self.assertIn(
+            'inserted 1, status changed 1, deleted 1', out.getvalue()
+        )
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(
+            set(AbbreviationEntry.objects.values_list(
+                'abbreviation', 'status'
+            )),
+            {
+                ('T4', 'approved'),
+                ('T3', 'approved'),
+                ('АЛТ', 'approved'),
+                ('ALT', 'for_review'),
+            },
+        )
+        self.assertEqual(
+            AbbreviationEntry.objects.get(pk=unchanged.pk).updated_at,
+            unchanged.updated_at,
+        )
+        entries, _ = search_entries(abbreviation='T3')
+        self.assertEqual(len(entries), 1)
+
+    def test_clean_db_bumps_version_once(self):
+        for abbreviation in ['T3', 'T4', 'ТТГ']:
+            AbbreviationEntry.objects.create(
+                abbreviation=abbreviation, description='hormone',
+                status='approved',
+            )
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            call_command('clean_db', stdout=StringIO())
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(AbbreviationEntry.objects.exists())
+        self.assertEqual(search_entries(abbreviation='T4'), ([], None))
+
+
+class ExtractCorpusCommandTests(SimpleTestCase):
+    def write_docx(self, path, abbreviation, description, text):
+        doc = Document()
+        doc.add_heading('СПИСОК СОКРАЩЕНИЙ', level=1)
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = abbreviation
+        table.cell(0, 1).text = description
+        doc.add_paragraph(text)
+        doc.save(path)
+
+    def test_workers_merge_pairs_of_all_files(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_dir = Path(tmp_dir) / 'corpus'
+            input_dir.mkdir()
+            self.write_docx(
+                input_dir / 'a.docx', 'ЭКГ', 'Электрокардиография',
+                'Пациенту выполнили ЭКГ в покое.',
+            )
+            self.write_docx(
+                input_dir / 'b.docx', 'ЭКГ', 'электрокардиография',
+                'Повторная ЭКГ без изменений.',
+            )
+            (input_dir / 'broken.docx').write_bytes(b'not a zip')
+            output_file = Path(tmp_dir) / 'out' / 'pairs.csv'
+            out = StringIO()
+
+            call_command(
+                'extract_abbs_word_to_csv', input_dir=str(input_dir),
+                output_file=str(output_file), workers=2, max_contexts=2,
+                cache_dir=str(Path(tmp_dir) / 'cache'),
+                stdout=out, stderr=StringIO(),
+            )
+
+            with open(output_file, encoding='utf-8-sig') as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1][:2], ['ЭКГ', 'электрокардиография'])
+        self.assertIn('в покое', rows[1][2])
+        self.assertIn('без изменений', rows[1][2])
+        self.assertIn('files/s', out.getvalue())
+
+    def test_unchanged_files_are_taken_from_the_cache(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_dir = Path(tmp_dir) / 'corpus'
+            input_dir.mkdir()
+            self.write_docx(
+                input_dir / 'a.docx', 'ЭКГ', 'электрокардиография',
+                'Пациенту выполнили ЭКГ в покое.',
+            )
+            self.write_docx(
+                input_dir / 'b.docx', 'АД', 'артериальное давление',
+                'АД в норме.',
+            )
+
+            def run():
+                out = StringIO()
+                call_command(
+                    'extract_abbs_word_to_csv', input_dir=str(input_dir),
+                    output_file=str(Path(tmp_dir) / 'pairs.csv'),
+                    cache_dir=str(Path(tmp_dir) / 'cache'), stdout=out,
+                )
+                with open(Path(tmp_dir) / 'pairs.csv', encoding='utf-8-sig') as f:
+                    rows = [row[0] for row in csv.reader(f)][1:]
+                return out.getvalue(), rows
+
+            output, rows = run()
+            self.assertIn('of 0 unchanged files, extracting 2 files', output)
+            self.assertEqual(rows, ['АД', 'ЭКГ'])
+
+            (input_dir / 'b.docx').unlink()
+            self.write_docx(
+                input_dir / 'c.docx', 'ЧСС', 'частота сердечных сокращений',
+                'ЧСС 70 в минуту.',
+            )
+            output, rows = run()
+            self.assertIn('of 1 unchanged files, extracting 1 files', output)
+            self.assertEqual(rows, ['ЧСС', 'ЭКГ'])
+            self.assertEqual(
+                len(list((Path(tmp_dir) / 'cache' / 'results').iterdir())),
+                2,
+            )
+
+    def test_cached_results_of_other_settings_are_not_reused(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_dir = Path(tmp_dir) / 'corpus'
+            input_dir.mkdir()
+            self.write_docx(
+                input_dir / 'a.docx', 'ЭКГ', 'электрокардиография',
+                'Пациенту выполнили ЭКГ в покое.',
+            )
+
+            def run(context_window):
+                out = StringIO()
+                call_command(
+                    'extract_abbs_word_to_csv', input_dir=str(input_dir),
+                    output_file=str(Path(tmp_dir) / 'pairs.csv'),
+                    cache_dir=str(Path(tmp_dir) / 'cache'),
+                    context_window=context_window, stdout=out,
+                )
+                with open(Path(tmp_dir) / 'pairs.csv', encoding='utf-8-sig') as f:
+                    rows = list(csv.reader(f))[1:]
+                return out.getvalue(), rows[0][2]
+
+            output, contexts = run(50)
+            self.assertIn('в покое', contexts)
+
+            output, contexts = run(3)
+            self.assertIn('of 0 unchanged files, extracting 1 files', output)
+            self.assertNotIn('в покое', contexts)
+
+
+class CleanDictionaryCommandTests(SimpleTestCase):
+    def test_chunks_are_cleaned_by_workers_in_input_order(self):
+        rows = [
+            ['АД', 'артериальное давление (blood pressure)', 'c1'],
+            ['A', 'alanine', 'c2'],
+            ['ЭКG', 'электрокардиография', 'c3'],
+            ['MRI', 'magnetic resonance imaging', 'c4'],
+            ['АД', 'что-то', 'c5'],
+            ['ТТГ', 'тиреотропный гормон', 'c6'],
+        ]
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / 'in.csv'
+            output_file = Path(tmp_dir) / 'out.csv'
+            with open(input_file, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['abbreviation', 'description', 'contexts'])
+                writer.writerows(rows)
+            out = StringIO()
+
+            call_command(
+                'clean_abb_dict', input_file=str(input_file),
+                output_file=str(output_file), workers=2, chunk_size=2,
+                stdout=out,
+            )
+
+            with open(output_file, encoding='utf-8-sig') as f:
+                result = list(csv.reader(f))[1:]
+
+        self.assertEqual(result, [
+            ['АД', 'артериальное давление', 'c1'],
+            ['MRI', 'magnetic resonance imaging', 'c4'],
+            ['ТТГ', 'тиреотропный гормон', 'c6'],
+        ])
+        self.assertIn(
+            'Initial: артериальное давление (blood pressure) -> '
+            'Cleaned (Russian): артериальное давление',
+            out.getvalue(),
+        )
+        self.assertIn('- Entries with no matching letters removed: 1', out.getvalue())
+
+    def test_invalid_row_fails_after_earlier_rows_without_output_file(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / 'in.csv'
+            output_file = Path(tmp_dir) / 'out.csv'
+            with open(input_file, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['abbreviation', 'description', 'contexts'])
+                writer.writerow(['ТТГ', 'тиреотропный гормон', 'c1'])
+                writer.writerow(['АД', 'артериальное давление (BP)', 'c2'])
+                writer.writerow(['ТТГ', 'тиреотропный гормон'])
+            out = StringIO()
+
+            with self.assertRaisesMessage(ValueError, 'Invalid row format'):
+                call_command(
+                    'clean_abb_dict', input_file=str(input_file),
+                    output_file=str(output_file), workers=2, chunk_size=1000,
+                    stdout=out,
+                )
+
+            self.assertEqual(
+                sorted(path.name for path in Path(tmp_dir).iterdir()),
+                ['in.csv'],
+            )
+        self.assertIn(
+            'Cleaned (Russian): артериальное давление', out.getvalue()
+        )
+
+    def test_output_file_mode_follows_umask(self):
+        with TemporaryDirectory() as tmp_dir:
+            input_file = Path(tmp_dir) / 'in.csv'
+            output_file = Path(tmp_dir) / 'out.csv'
+            with open(input_file, 'w', encoding='utf-8-sig', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['abbreviation', 'description', 'contexts'])
+            umask = os.umask(0o022)
+            self.addCleanup(os.umask, umask)
+
+            call_command(
+                'clean_abb_dict', input_file=str(input_file),
+                output_file=str(output_file), workers=1, stdout=StringIO(),
+            )
+
+            self.assertEqual(stat.S_IMODE(output_file.stat().st_mode), 0o644)
+
+
+class BuildDictionaryCommandTests(TestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        settings = override_settings(
+            DICTIONARY_VERSION_FILE=str(Path(self.tmp_dir.name) / 'version'),
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.input_dir = Path(self.tmp_dir.name) / 'corpus'
+        self.input_dir.mkdir()
+        write_docx = ExtractCorpusCommandTests.write_docx
+        write_docx(
+            self, self.input_dir / 'a.docx', 'АД',
+            'Артериальное давление (blood pressure)', 'АД в норме.',
+        )
+        write_docx(
+            self, self.input_dir / 'b.docx', 'АД', 'артериальное давление',
+            'Измерили АД.',
+        )
+        write_docx(
+            self, self.input_dir / 'c.docx', 'ЭКГ', 'электрокардиография',
+            'ЭКГ без изменений.',
+        )
+
+    def build(self, **options):
+        out = StringIO()
+        call_command(
+            'build_dictionary', input_dir=str(self.input_dir), stdout=out,
+            **options,
+        )
+        return out.getvalue()
+
+    def test_dry_run_only_reports_counts(self):
+        output = self.build(dry_run=True)
+
+        self.assertIn('- Pairs extracted: 3', output)
+        self.assertIn('- Entries removed by cleaning: 1', output)
+        self.assertIn('- Repeated entries after cleaning: 1', output)
+        self.assertIn('- Entries to insert: 1', output)
+        self.assertFalse(AbbreviationEntry.objects.exists())
+
+    def test_cleaned_entries_are_inserted_once(self):
+        self.build(status='approved', batch_size=1)
+        output = self.build(status='approved')
+
+        self.assertEqual(
+            list(AbbreviationEntry.objects.values_list(
+                'abbreviation', 'description', 'status'
+            )),
+            [('АД', 'артериальное давление', 'approved')],
+        )
+        self.assertIn('- Entries already in the database: 1', output)
+        self.assertIn('- Entries inserted: 0', output)
+
+    def test_conflicting_entries_are_not_counted_as_inserted(self):
+        AbbreviationEntry.objects.create(
+            abbreviation='АД', description='артериальное давление'
+        )
+        AbbreviationEntry.objects.create(
+            abbreviation='T4', description='thyroxine'
+        )
+
+        # АД looks new, as if it was inserted after the batch was checked
+        with mock.patch(
+            'abb_app.management.commands.build_dictionary.split_new_pairs',
+            side_effect=lambda batch: (batch, []),
+        ):
+            output = self.build(status='approved')
+
+        self.assertIn('- Entries already in the database: 1', output)
+        self.assertIn('- Entries inserted: 0', output)
+        self.assertEqual(AbbreviationEntry.objects.count(), 2)
@@ -0,0 +1,183 @@
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TransactionTestCase, override_settings
+
+from abb_app.admin import approve_entries
+from abb_app.dictionary_snapshot import DictionarySnapshot, open_snapshot
+from abb_app.models import AbbreviationEntry
+from abb_app.services.abbreviations import load_approved_dictionary
+from abb_app.services.dictionary import (
+    _snapshot_lock,
+    get_approved_dictionary,
+    get_description_index,
+    get_dictionary_version,
+)
+from abb_app.utils import AbbreviationDictionary
+
+
+class DictionaryCacheTests(TransactionTestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        settings = override_settings(
+            DICTIONARY_VERSION_FILE=str(Path(self.tmp_dir.name) / 'version'),
+            DICTIONARY_SNAPSHOT_FILE=str(Path(self.tmp_dir.name) / 'snapshot'),
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_dictionary_is_reloaded_only_after_changes(self):
+        entry = AbbreviationEntry.objects.create(
+            abbreviation='T4', description='thyroxine', status='approved'
+        )
+        version = get_dictionary_version()
+        dictionary = get_approved_dictionary()
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_approved_dictionary(), dictionary)
+        self.assertEqual(dictionary.abbreviations, {'T4'})
+
+        entry.delete()
+
+        self.assertNotEqual(get_dictionary_version(), version)
+        self.assertEqual(len(get_approved_dictionary()), 0)
+
+    def test_only_approved_changes_bump_version(self):
+        AbbreviationEntry.objects.create(
+            abbreviation='T4', description='thyroxine', status='approved'
+        )
+        version = get_dictionary_version()
+        index = get_description_index()
+
+        entry = AbbreviationEntry.objects.create(
+            abbreviation='T4', description='free thyroxine'
+        )
+        entry.highlighted = 'T4'
+        entry.save()
+
+        self.assertEqual(get_dictionary_version(), version)
+        self.assertIs(get_description_index(), index)
+        self.assertEqual(
+            index.find_duplicate('T4', 'Free thyroxine'), 'free thyroxine'
+        )
+
+        entry.status = 'approved'
+        entry.save()
+        approved_version = get_dictionary_version()
+        self.assertNotEqual(approved_version, version)
+
+        entry.status = 'rejected'
+        entry.save()
+        self.assertNotEqual(get_dictionary_version(), approved_version)
+        self.assertIsNone(
+            get_description_index().find_duplicate('T4', 'free thyroxine')
+        )
+
+    def test_bulk_approval_bumps_version(self):
+        AbbreviationEntry.objects.create(abbreviation='ЭКГ', description='ecg')
+        self.assertEqual(len(get_approved_dictionary()), 0)
+
+        approve_entries(Mock(), None, AbbreviationEntry.objects.all())
+
+        self.assertEqual(get_approved_dictionary().abbreviations, {'ЭКГ'})
+
+    def test_snapshot_is_rebuilt_when_dictionary_changes(self):
+        for abbreviation, description in [
+            ('TNM', 'tumor'),
+            ('HbA1c', 'glycated hemoglobin'),
+            ('т.е.', 'то есть'),
+        ]:
+            AbbreviationEntry.objects.create(
+                abbreviation=abbreviation, description=description,
+                status='approved',
+            )
+        call_command('build_dictionary_snapshot', stdout=StringIO())
+        text = 'HbA1c и TNM, т.е. HBA1c, а т.е.б нет'
+        dictionary = AbbreviationDictionary(load_approved_dictionary())
+
+        with self.assertNumQueries(0):
+            snapshot = get_approved_dictionary()
+            self.assertEqual(
+                snapshot.automaton.find_occurrences(text),
+                dictionary.automaton.find_occurrences(text),
+            )
+            self.assertEqual(
+                snapshot.suggestion_index.suggest('HBA1c'), ['HbA1c']
+            )
+        self.assertIsInstance(snapshot, DictionarySnapshot)
+        self.assertEqual(
+            snapshot.by_abbreviation['TNM']['descriptions'], ['tumor']
+        )
+        self.assertEqual(
+            snapshot.homoglyph_index.lookup('ТNM')[0]['abbreviation'],
+            'TNM',
+        )
+
+        snapshot_file = Path(settings.DICTIONARY_SNAPSHOT_FILE)
+        built = snapshot_file.stat().st_mtime_ns
+
+        AbbreviationEntry.objects.create(
+            abbreviation='ЭКГ', description='ecg', status='approved'
+        )
+
+        # Saving only bumps the version, the snapshot is rebuilt on use
+        self.assertEqual(snapshot_file.stat().st_mtime_ns, built)
+        snapshot = get_approved_dictionary()
+        self.assertIsInstance(snapshot, DictionarySnapshot)
+        self.assertEqual(
+            set(snapshot.abbreviations), {'TNM', 'HbA1c', 'т.е.', 'ЭКГ'}
+        )
+
+    def test_snapshot_rebuilt_elsewhere_is_not_rebuilt_again(self):
+        AbbreviationEntry.objects.create(
+            abbreviation='TNM', description='tumor', status='approved'
+        )
+        call_command('build_dictionary_snapshot', stdout=StringIO())
+        AbbreviationEntry.objects.create(
+            abbreviation='ЭКГ', description='ecg', status='approved'
+        )
+
+        # Another process holds the lock while rebuilding
+        with _snapshot_lock() as locked:
+            self.assertTrue(locked)
+            dictionary = get_approved_dictionary()
+
+        self.assertNotIsInstance(dictionary, DictionarySnapshot)
+        self.assertEqual(dictionary.abbreviations, {'TNM', 'ЭКГ'})
+        self.assertIsNone(open_snapshot(
+            settings.DICTIONARY_SNAPSHOT_FILE, get_dictionary_version()
+        ))
+
+    def test_dictionary_page_is_served_from_cache_until_changed(self):
+        cache.clear()
+        AbbreviationEntry.objects.create(
+            abbreviation='T4', description='thyroxine', status='approved'
+        )
+
+        response = self.client.get('/dictionary/')
+        etag = response['ETag']
+        self.assertContains(response, 'thyroxine')
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get('/dictionary/')
+            not_modified = self.client.get(
+                '/dictionary/', HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(not_modified.status_code, 304)
+
+        AbbreviationEntry.objects.create(
+            abbreviation='T3', description='triiodothyronine',
+            status='approved',
+        )
+        response = self.client.get('/dictionary/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'triiodothyronine')
+        self.assertContains(response, 'Всего записей: 2')
@@ -0,0 +1,207 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.test import SimpleTestCase
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+
+from abb_app.docx_reader import (
+    MC_NS,
+    W_NS,
+    DocumentVisitor,
+    DocumentWalker,
+    DocxReader,
+)
+
+TEXT_BOX_RUN = f'''
+<w:r xmlns:w="{W_NS}" xmlns:mc="{MC_NS}">
+  <mc:AlternateContent>
+    <mc:Choice Requires="wps"><w:drawing><w:txbxContent>
+      <w:p><w:r><w:t>В рамке</w:t></w:r></w:p>
+    </w:txbxContent></w:drawing></mc:Choice>
+    <mc:Fallback><w:pict><w:txbxContent>
+      <w:p><w:r><w:t>В рамке</w:t></w:r></w:p>
+    </w:txbxContent></w:pict></mc:Fallback>
+  </mc:AlternateContent>
+</w:r>
+'''
+
+CONTENT_CONTROL = f'''
+<w:sdt xmlns:w="{W_NS}">
+  <w:sdtPr><w:alias w:val="Поле"/></w:sdtPr>
+  <w:sdtContent>
+    <w:p><w:r><w:t>Внутри ЭКГ</w:t></w:r></w:p>
+  </w:sdtContent>
+</w:sdt>
+'''
+
+WRAPPED_RUNS = f'''
+<w:p xmlns:w="{W_NS}">
+  <w:pPr><w:pStyle w:val="Heading1"/></w:pPr>
+  <w:ins w:id="1" w:author="A"><w:r><w:t xml:space="preserve">СПИСОК </w:t></w:r></w:ins>
+  <w:del w:id="2" w:author="A"><w:r><w:delText>СТАРЫХ </w:delText></w:r></w:del>
+  <w:fldSimple w:instr="DOCPROPERTY Title">
+    <w:smartTag w:uri="u" w:element="e"><w:r><w:t>СОКРА</w:t></w:r></w:smartTag>
+  </w:fldSimple>
+  <w:sdt><w:sdtContent><w:r><w:t>ЩЕНИЙ</w:t></w:r></w:sdtContent></w:sdt>
+</w:p>
+'''
+
+
+class RecordingVisitor(DocumentVisitor):
+    def __init__(self, parts=None, stop_at=None):
+        self.parts = parts
+        self.stop_at = stop_at
+        self.events = []
+
+    def start_part(self, part):
+        self.events.append(('part', part))
+
+    def visit_table(self, element, index, part):
+        self.events.append(('table', index))
+
+    def visit_paragraph(self, paragraph):
+        self.events.append(('p', paragraph.text))
+        if paragraph.text == self.stop_at:
+            self.finished = True
+
+
+class DocxReaderTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp_dir = TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / 'document.docx'
+
+        doc = Document()
+        doc.add_heading('Введение', 1)
+        paragraph = doc.add_paragraph('Уровень ')
+        paragraph.add_run('T4').bold = True
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = 'ЭКГ'
+        table.cell(0, 1).text = 'электрокардиограмма'
+        doc.add_paragraph('a\tb')
+        doc.save(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_paragraphs_are_streamed_with_flags(self):
+        paragraphs = list(DocxReader(self.path).iter_paragraphs())
+
+        self.assertEqual(
+            [(p.text, p.is_heading, p.is_bold, p.table) for p in paragraphs],
+            [
+                ('Введение', True, True, None),
+                ('Уровень T4', False, True, None),
+                ('ЭКГ', False, False, 0),
+                ('электрокардиограмма', False, False, 0),
+                ('a\tb', False, False, None),
+            ],
+        )
+
+    def test_consumed_blocks_are_cleared(self):
+        blocks = DocxReader(self.path).iter_body()
+        first = next(blocks)
+        self.assertEqual(len(first), 2)
+
+        next(blocks)
+
+        self.assertEqual(len(first), 0)
+
+    def test_style_flags_follow_based_on_chain(self):
+        doc = Document()
+        bold_style = doc.styles.add_style('Bold Body', WD_STYLE_TYPE.PARAGRAPH)
+        bold_style.font.bold = True
+        child_style = doc.styles.add_style('Chapter', WD_STYLE_TYPE.PARAGRAPH)
+        child_style.base_style = doc.styles['Heading 1']
+        doc.add_paragraph('СПИСОК ЛИТЕРАТУРЫ', style='Bold Body')
+        doc.add_paragraph('Глава', style='Chapter')
+        doc.save(self.path)
+
+        paragraphs = list(DocxReader(self.path).iter_paragraphs())
+
+        self.assertEqual(
+            [(p.is_heading, p.is_bold) for p in paragraphs],
+            [(False, True), (True, True)],
+        )
+
+    def test_all_text_parts_are_read_in_one_pass(self):
+        doc = Document()
+        doc.sections[0].header.paragraphs[0].text = 'Колонтитул'
+        doc.sections[0].footer.paragraphs[0].text = 'Нижний'
+        paragraph = doc.add_paragraph('Текст')
+        paragraph._p.append(parse_xml(TEXT_BOX_RUN))
+        doc.save(self.path)
+
+        paragraphs = list(DocxReader(self.path).iter_paragraphs())
+
+        self.assertEqual(
+            [(p.text, p.part, p.text_box) for p in paragraphs],
+            [
+                ('Текст', 'document', False),
+                ('В рамке', 'document', True),
+                ('Колонтитул', 'header', False),
+                ('Нижний', 'footer', False),
+            ],
+        )
+
+    def test_walker_feeds_all_visitors_in_one_pass(self):
+        doc = Document(self.path)
+        doc.sections[0].header.paragraphs[0].text = 'Колонтитул'
+        doc.save(self.path)
+        everything = RecordingVisitor()
+        body = RecordingVisitor(parts={'document'}, stop_at='ЭКГ')
+
+        DocumentWalker(DocxReader(self.path)).walk(everything, body)
+
+        self.assertEqual(everything.events, [
+            ('part', 'document'),
+            ('p', 'Введение'),
+            ('p', 'Уровень T4'),
+            ('table', 0),
+            ('p', 'ЭКГ'),
+            ('p', 'электрокардиограмма'),
+            ('p', 'a\tb'),
+            ('part', 'header'),
+            ('p', 'Колонтитул'),
+        ])
+        self.assertEqual(body.events, everything.events[:5])
+
+    def test_content_controls_of_the_body_are_read(self):
+        doc = Document()
+        doc.add_paragraph('До')._p.addnext(parse_xml(CONTENT_CONTROL))
+        doc.add_paragraph('После')
+        doc.save(self.path)
+
+        paragraphs = list(DocxReader(self.path).iter_paragraphs())
+
+        self.assertEqual(
+            [p.text for p in paragraphs], ['До', 'Внутри ЭКГ', 'После']
+        )
+
+    def test_runs_of_inline_containers_are_read(self):
+        doc = Document()
+        doc.add_paragraph('До')._p.addnext(parse_xml(WRAPPED_RUNS))
+        doc.save(self.path)
+
+        paragraphs = list(DocxReader(self.path).iter_paragraphs())
+
+        self.assertEqual(
+            [p.text for p in paragraphs], ['До', 'СПИСОК СОКРАЩЕНИЙ']
+        )
+
+    def test_nested_hyperlinks_mark_the_paragraph(self):
+        doc = Document()
+        doc.add_paragraph('До')._p.addnext(parse_xml(f'''
+            <w:p xmlns:w="{W_NS}"><w:ins w:id="1" w:author="A"><w:hyperlink>
+              <w:r><w:t>Список сокращений</w:t></w:r>
+            </w:hyperlink></w:ins></w:p>
+        '''))
+        doc.save(self.path)
+
+        paragraphs = list(DocxReader(self.path).iter_paragraphs())
+
+        self.assertEqual(
+            [(p.text, p.has_hyperlink) for p in paragraphs],
+            [('До', False), ('Список сокращений', True)],
+        )
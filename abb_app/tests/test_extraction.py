@@ -1,6 +1,28 @@
-from django.test import SimpleTestCase
+import sys
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
-from abb_app.utils import CharacterValidator, TextProcessor
+import regex
+from django.test import SimpleTestCase, TestCase, override_settings
+from docx import Document
+
+from abb_app.docx_reader import DocxReader
+from abb_app.services import documents
+from abb_app.utils import (
+    WORD_CHAR_CLASS,
+    AbbreviationDictionary,
+    CharacterValidator,
+    ContextFinder,
+    SuggestionIndex,
+    TextProcessor,
+    build_contexts,
+    detect_string_alphabet,
+    is_word_char,
+    process_abbreviations,
+    split_by_language,
+)
 
 
 class TextProcessorTests(SimpleTestCase):
@@ -24,6 +46,138 @@ class TextProcessorTests(SimpleTestCase):
 
         self.assertEqual(result['ABC'], 1)
 
+    def test_index_keeps_offsets_of_each_occurrence(self):
+        processor = TextProcessor()
+        text = '(ABC) и «XYZ» и ABC, ABC-терапия'
+
+        result = processor.index_abbreviations(text, set())
+
+        self.assertEqual(list(result), ['ABC'])
+        self.assertEqual(list(result['ABC']), [1, 16])
+
+    def test_dictionary_entries_beyond_single_tokens_are_found(self):
+        processor = TextProcessor()
+        dictionary = AbbreviationDictionary([
+            {'abbreviation': abb, 'descriptions': []}
+            for abb in ('т.е.', 'p value', 'ЭКГ')
+        ])
+        text = 'ЭКГ, т.е. p value и "p value", p-value ЭКГ'
+
+        result = processor.index_abbreviations(
+            text, dictionary.abbreviations, dictionary.automaton
+        )
+
+        self.assertEqual(
+            {abb: list(offsets) for abb, offsets in result.items()},
+            {'ЭКГ': [0, 39], 'т.е.': [5], 'p value': [10]},
+        )
+        self.assertEqual(list(result), ['ЭКГ', 'т.е.', 'p value'])
+
+    def test_compound_forms_are_pruned_for_10k_candidates(self):
+        processor = TextProcessor()
+        standalone = [f'AB{n}' for n in range(5000)]
+        text = ' '.join(
+            standalone
+            + [f'{abb}-терапия' for abb in standalone[:2000]]
+            + [f'анти-{abb}' for abb in standalone[2000:3000]]
+            + [f'{abb}/AB0' for abb in standalone[3000:4000]]
+            + [f'CD{n}-терапия' for n in range(1000)]
+        )
+
+        result = processor.extract_abbreviations(text, set())
+
+        self.assertEqual(
+            set(result),
+            set(standalone) | {f'CD{n}-терапия' for n in range(1000)},
+        )
+
+    def test_sharded_index_matches_serial_index(self):
+        processor = TextProcessor()
+        text = ' '.join(
+            f'ABC и «XYZ {n}» CD{n % 7} ABC-терапия CD{n % 7}-терапия'
+            for n in range(300)
+        )
+
+        expected = processor.index_abbreviations(text, set())
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result, contexts = processor.index_abbreviations_sharded(
+                text, set(), executor, shard_count=5, window=20
+            )
+
+        self.assertEqual(list(result), list(expected))
+        for abb, offsets in expected.items():
+            self.assertEqual(list(result[abb]), list(offsets))
+            self.assertEqual(
+                contexts[abb],
+                build_contexts(text, offsets, len(abb), window=20),
+            )
+
+
+class RelevantTextTests(SimpleTestCase):
+    def test_table_and_text_are_read_in_one_walk(self):
+        doc = Document()
+        doc.add_heading('СПИСОК СОКРАЩЕНИЙ', 1)
+        doc.add_table(rows=1, cols=2).cell(0, 0).text = 'ЭКГ'
+        doc.add_paragraph('Введение', style='Heading 1')
+        doc.add_table(rows=1, cols=2).cell(0, 0).text = 'ALT'
+        doc.add_heading('СПИСОК ЛИТЕРАТУРЫ', 1)
+        doc.add_table(rows=1, cols=1).cell(0, 0).text = 'PMID'
+
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'document.docx'
+            doc.save(path)
+            table, text = TextProcessor().read_document(DocxReader(path))
+
+        self.assertEqual(table, [{'abbreviation': 'ЭКГ', 'descriptions': ['']}])
+        self.assertEqual(text, 'СПИСОК СОКРАЩЕНИЙ Введение ALT')
+
+
+class ContextFinderTests(SimpleTestCase):
+    def test_finds_all_abbreviations_in_one_pass(self):
+        finder = ContextFinder(['IgG', 'IgG-1', 'ЭКГ'])
+
+        result = finder.find_occurrences(
+            'IgG-1 и IgG; подклассы IgGs. ЭКГ, ЭКГ-контроль'
+        )
+
+        self.assertEqual(result['IgG'], [0, 8])
+        self.assertEqual(result['IgG-1'], [0])
+        self.assertEqual(result['ЭКГ'], [29, 34])
+
+    def test_contexts_are_unique_and_limited(self):
+        finder = ContextFinder(['T4'])
+
+        result = finder.find_contexts('T4 T4 T4', window=0, max_contexts=2)
+
+        self.assertEqual(result['T4'], ['...T4...'])
+
+    def test_threaded_search_matches_single_pass(self):
+        finder = ContextFinder(['IgG', 'IgG-1', 'IgG1', 'ЭКГ', 'T4'])
+        text = (
+            'IgG-1 и IgG; IgG1 подклассы IgGs. ЭКГ, ЭКГ-контроль T4 IgG '
+            'ЭКГ\u0301 T4\u203f IgG² ЭКГ_'
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = finder.find_occurrences(text, executor, task_count=2)
+
+        self.assertEqual(
+            list(result.items()), list(finder.find_occurrences(text).items())
+        )
+
+    def test_word_char_class_matches_re(self):
+        pattern = regex.compile(WORD_CHAR_CLASS)
+        # Characters unassigned in unicodedata may be letters for `regex`
+        chars = [
+            chr(code) for code in range(sys.maxunicode + 1)
+            if unicodedata.category(chr(code)) != 'Cn'
+        ]
+
+        self.assertEqual(
+            [char for char in chars if bool(pattern.match(char)) != is_word_char(char)],
+            [],
+        )
+
 
 class CharacterValidatorTests(SimpleTestCase):
     def test_mixed_alphabet_matches_dictionary_form(self):
@@ -39,4 +193,76 @@ class CharacterValidatorTests(SimpleTestCase):
         self.assertEqual(
             result['descriptions'],
             ['Tumor Node Metastasis'],
-        )
\ No newline at end of file
+        )
+
+    def test_index_matches_long_abbreviations(self):
+        validator = CharacterValidator()
+        index = validator.build_index([
+            {'abbreviation': 'ABCEHKMOPTXABCEHKMOP', 'descriptions': ['long']},
+            {'abbreviation': 'CT', 'descriptions': ['latin']},
+            {'abbreviation': 'СТ', 'descriptions': ['cyrillic']},
+        ])
+
+        result = validator.validate_abbreviation('АВСЕНКМОРТХABCEHKMOP', index)
+
+        self.assertEqual(result['correct_form'], 'ABCEHKMOPTXABCEHKMOP')
+        self.assertEqual(result['descriptions'], ['long'])
+        with self.assertRaises(ValueError):
+            validator.validate_abbreviation('CТ', index)
+
+
+class SuggestionIndexTests(SimpleTestCase):
+    def test_suggests_entries_within_small_edit_distance(self):
+        index = SuggestionIndex(['HbA1c', 'ALT-AST', 'АЛТ', 'ЭКГ'])
+
+        self.assertEqual(index.suggest('HbA1C'), ['HbA1c'])
+        self.assertEqual(index.suggest('ALTAST'), ['ALT-AST'])
+        self.assertEqual(index.suggest('ЭГК'), ['ЭКГ'])
+        self.assertEqual(index.suggest('ЭКГ'), [])
+        self.assertEqual(index.suggest('МРТ'), [])
+
+    def test_unknown_abbreviations_get_suggestions(self):
+        dictionary = AbbreviationDictionary([
+            {'abbreviation': 'HbA1c', 'descriptions': ['гликированный гемоглобин']},
+        ])
+        result = process_abbreviations(
+            None, dictionary, text='Уровень HbA1C снизился.'
+        )
+
+        entry = next(abb for abb in result if abb['abbreviation'] == 'HbA1C')
+        self.assertEqual(entry['descriptions'], [])
+        self.assertEqual(
+            [suggestion['abbreviation'] for suggestion in entry['suggestions']],
+            ['HbA1c'],
+        )
+
+
+class ScriptClassifierTests(SimpleTestCase):
+    def test_alphabet_of_whole_strings(self):
+        self.assertEqual(detect_string_alphabet('ЭКГ'), 'russian')
+        self.assertEqual(detect_string_alphabet('HbA1c'), 'latin')
+        self.assertEqual(detect_string_alphabet('ЭКG'), 'mixed')
+        self.assertEqual(detect_string_alphabet('12-3'), 'other')
+
+    def test_description_is_split_by_script_of_words(self):
+        self.assertEqual(
+            split_by_language('интерлейкин-6 (IL-6); interleukin 6.'),
+            ('интерлейкин-6', 'IL-6 interleukin'),
+        )
+
+
+class ProcessDocumentTests(TestCase):
+    @override_settings(EXTRACTION_WORKERS=4)
+    def test_short_document_does_not_start_the_pool(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / 'document.docx'
+            doc = Document()
+            doc.add_paragraph('Уровень ТТГ в норме, ТТГ повторно.')
+            doc.save(path)
+
+            result = documents.process_document(str(path))
+
+        self.assertEqual(
+            [abb['abbreviation'] for abb in result.abbreviations], ['ТТГ']
+        )
+        self.assertIsNone(documents._extraction_executor)
@@ -62,3 +62,37 @@ class UpdateAbbreviationViewTests(TestCase):
             ).count(),
             1,
         )
+
+    def test_reformatted_existing_description_is_not_submitted(self):
+        AbbreviationEntry.objects.create(
+            abbreviation='T4',
+            description='Тироксин (свободный)',
+            status='approved',
+        )
+
+        response = self.post_json({
+            'abbreviation': 'T4',
+            'description': 'тироксин свободный',
+            'action': 'add',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            AbbreviationEntry.objects.filter(abbreviation='T4').count(),
+            1,
+        )
+
+    def test_similar_descriptions_are_returned_while_typing(self):
+        AbbreviationEntry.objects.create(
+            abbreviation='T4',
+            description='Тироксин',
+            status='for_review',
+        )
+
+        response = self.client.get(
+            '/similar_descriptions/',
+            {'abbreviation': 'T4', 'description': 'тироксн'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['similar'], ['Тироксин'])
@@ -5,6 +5,7 @@ from django.test import TestCase
 from docx import Document
 
 from abb_app.models import AbbreviationEntry
+from abb_app.services.search import encode_cursor, search_entries
 
 
 class ProcessingViewTests(TestCase):
@@ -64,4 +65,93 @@ class TableGenerationViewTests(TestCase):
         self.assertEqual(table.rows[0].cells[0].text, 'Аббревиатура')
         self.assertEqual(table.rows[0].cells[1].text, 'Расшифровка')
         self.assertEqual(table.rows[1].cells[0].text, 'T4')
-        self.assertEqual(table.rows[1].cells[1].text, 'Thyroxine')
\ No newline at end of file
+        self.assertEqual(table.rows[1].cells[1].text, 'Thyroxine')
+
+class DictionaryEntriesViewTests(TestCase):
+    def setUp(self):
+        for number in range(5):
+            AbbreviationEntry.objects.create(
+                abbreviation=f'AB{number}',
+                description=f'description {number}',
+                status='approved',
+            )
+        AbbreviationEntry.objects.create(
+            abbreviation='АЛТ',
+            description='аланинаминотрансфераза',
+            status='approved',
+        )
+        AbbreviationEntry.objects.create(
+            abbreviation='АСТ',
+            description='аспартатаминотрансфераза',
+            status='for_review',
+        )
+
+    def get_entries(self, **params):
+        response = self.client.get('/dictionary/entries/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_pages_follow_the_cursor_without_gaps(self):
+        abbreviations = []
+        entries, cursor = search_entries(limit=4)
+        abbreviations += [entry.abbreviation for entry in entries]
+
+        data = self.get_entries(cursor=encode_cursor(cursor))
+        abbreviations += [entry['abbreviation'] for entry in data['entries']]
+
+        self.assertIsNone(data['next_cursor'])
+        self.assertEqual(
+            abbreviations,
+            ['AB0', 'AB1', 'AB2', 'AB3', 'AB4', 'АЛТ'],
+        )
+
+    def test_search_matches_substrings_of_approved_entries(self):
+        data = self.get_entries(description='аминотрансфераза')
+        self.assertEqual(
+            [entry['abbreviation'] for entry in data['entries']],
+            ['АЛТ'],
+        )
+
+        data = self.get_entries(abbreviation='лт', description='АЛАНИН')
+        self.assertEqual(
+            [entry['abbreviation'] for entry in data['entries']],
+            ['АЛТ'],
+        )
+
+        data = self.get_entries(abbreviation='ас', description='аспартат')
+        self.assertEqual(data['entries'], [])
+
+    def test_pages_follow_the_chosen_order(self):
+        data = self.get_entries(order='-description', limit=25)
+        self.assertEqual(
+            [entry['abbreviation'] for entry in data['entries']],
+            ['АЛТ', 'AB4', 'AB3', 'AB2', 'AB1', 'AB0'],
+        )
+
+        entries, cursor = search_entries(limit=2, order='-updated_at')
+        later, _ = search_entries(after=cursor, limit=4, order='-updated_at')
+        self.assertEqual(
+            [entry.abbreviation for entry in entries + later],
+            ['АЛТ', 'AB4', 'AB3', 'AB2', 'AB1', 'AB0'],
+        )
+
+        for params in ({'order': 'status'}, {'limit': 1000}):
+            response = self.client.get('/dictionary/entries/', params)
+            self.assertEqual(response.status_code, 400)
+
+    def test_search_follows_entry_changes(self):
+        entry = AbbreviationEntry.objects.get(abbreviation='АСТ')
+        entry.status = 'approved'
+        entry.save()
+        self.assertEqual(
+            len(self.get_entries(abbreviation='АСТ')['entries']),
+            1,
+        )
+
+        entry.delete()
+        self.assertEqual(self.get_entries(abbreviation='АСТ')['entries'], [])
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get('/dictionary/entries/', {'cursor': 'x'})
+
+        self.assertEqual(response.status_code, 400)
@@ -2,12 +2,14 @@ from django.contrib import admin
 from django.urls import path
 
 from .views import (
+    dictionary_entries,
     dictionary_view,
     download_demo_document,
     end_document_session,
     generate_description,
     make_abbreviation_table,
     process_file_with_session,
+    similar_descriptions,
     touch_document_session,
     update_abbreviation,
     update_difference_section,
@@ -20,6 +22,8 @@ urlpatterns = [
     path('demo/document/', download_demo_document,
          name='download_demo_document'),
     path('dictionary/', dictionary_view, name='dictionary'),
+    path('dictionary/entries/', dictionary_entries,
+         name='dictionary_entries'),
     path('generate_description/', generate_description,
          name='generate_description'),
     path('make_abbreviation_table/', make_abbreviation_table,
@@ -30,6 +34,8 @@ urlpatterns = [
          name='end_document_session'),
     path('session/touch/', touch_document_session,
          name='touch_document_session'),
+    path('similar_descriptions/', similar_descriptions,
+         name='similar_descriptions'),
     path('update_abbreviation/', update_abbreviation,
          name='update_abbreviation'),
     path('update_difference_section/', update_difference_section,
@@ -1,14 +1,24 @@
 import re
 import regex
+from array import array
 from docx import Document
 from docx.shared import Pt, RGBColor, Cm
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 from collections import Counter
+from concurrent.futures import Executor
+from functools import cached_property, lru_cache
 from docx.table import _Cell, Table
-from docx.oxml.table import CT_Tbl
+from lxml import etree
 from typing import (
-    TypedDict, Union, List, Dict, Set, Counter, Optional
+    TypedDict, Union, List, Dict, Set, Counter, Optional, Iterable, Tuple
+)
+
+from .docx_reader import (
+    DocumentVisitor,
+    DocumentWalker,
+    DocxParagraph,
+    DocxReader,
 )
 
 
@@ -32,6 +42,15 @@ EXCLUDE_TERMS = {
     'СПОНСОРА', 'ЦЕНТРА', 'ТЕРМИНЫ', 'ЦЕЛЬ'
 }
 
+QUOTED_TEXT_PATTERN = re.compile(r'«\S+?»|"[^"]+"')
+TOKEN_PATTERN = re.compile(r'\S+')
+WHITESPACE_PATTERN = re.compile(r'\s')
+TWO_CAPITALS_PATTERN = re.compile(r'[A-ZА-ЯЁ].*[A-ZА-ЯЁ]')
+TRAILING_PARENTHESES_PATTERN = re.compile(r'\)+$')
+CYRILLIC_WORD_PATTERN = re.compile(r'[А-Яа-яЁё]+')
+CYRILLIC_LOWERCASE_PATTERN = re.compile(r'[а-яё]')
+TOKEN_CACHE_SIZE = 65536
+
 ROMAN_NUMERAL_PATTERN = re.compile(
     r'(?=[IVXLCDM]+$)M{0,3}(?:CM|CD|D?C{0,3})'
     r'(?:XC|XL|L?X{0,3})(?:IX|IV|V?I{0,3})',
@@ -57,6 +76,7 @@ class Abbreviation(TypedDict):
     highlighted: Optional[List[Dict]]  # For display
     status: Optional[str]  # For tracking state
     is_ai_generated: bool # is the description was generated by model?
+    suggestions: List['Abbreviation']  # Close dictionary entries if unknown
 
 
 # -----------------------------------------------------------------------------
@@ -71,54 +91,38 @@ class AbbreviationTableExtractor:
 
     def __init__(self, section_patterns: List[str] = SECTION_PATTERNS):
         self.section_patterns = section_patterns
+        self._casefolded_patterns = [
+            pattern.casefold() for pattern in section_patterns
+        ]
 
-    def get_abbreviation_table(self, doc: Document) -> List[Abbreviation]:
+    def get_abbreviation_table(self, doc: DocxReader) -> List[Abbreviation]:
         """Extract abbreviations table from document"""
-        table_element = self._extract_table_element(doc)
-        if table_element is None:
-            return []
+        locator = AbbreviationTableLocator(self)
+        DocumentWalker(doc).walk(locator)
+        return locator.abbreviations
+
+    def is_section_title(self, paragraph: DocxParagraph) -> bool:
+        """Checks if paragraph is the title of the abbreviation list section."""
+        para_text = paragraph.text.strip()
+        casefolded_text = para_text.casefold()
+        if not any(pattern in casefolded_text
+            for pattern in self._casefolded_patterns):
+            return False
 
-        return self._parse_table(table_element)
-    
-    def _extract_table_element(self, doc: Document) -> Optional[CT_Tbl]:
-        """
-        Extract the first table following a section matching `section_patterns`.
-        Returns the block containing the table, or None if not found.
-        """
-        found_section = False
-        
-        for block in doc.element.body:
-            if block.tag.endswith('p'): # paragraph block
-                para_text = ''.join(
-                    node.text for node in block.findall(
-                        './/w:t', namespaces=self.NS
-                    ) if node.text
-                ).strip()
+        # Must NOT have a hyperlink (avoid ToC lines)
+        if paragraph.has_hyperlink:
+            return False
 
-                if any(pattern.casefold() in para_text.casefold()
-                    for pattern in self.section_patterns):
-                    
-                    # Must NOT have a hyperlink (avoid ToC lines)
-                    if block.find('.//w:hyperlink', namespaces=self.NS) is not None:
-                        continue
-                    
-                    # Must NOT end with a digit (avoid missformated ToC)
-                    if para_text.strip().endswith(tuple("0123456789")):
-                        continue
-                    
-                    # Must have some heading indication (pStyle or outlineLvl)
-                    para_style = block.find('.//w:pStyle', namespaces=self.NS)
-                    outline_level = block.find('.//w:outlineLvl', namespaces=self.NS)
-                    if para_style is not None or outline_level is not None:
-                        found_section = True
-                        continue
-
-            if found_section and block.tag.endswith('tbl'):
-                return block
+        # Must NOT end with a digit (avoid missformated ToC)
+        if para_text.endswith(tuple("0123456789")):
+            return False
 
-        return None
+        # Must have some heading indication (pStyle or outlineLvl)
+        return paragraph.has_outline
         
-    def _parse_table(self, table_element: CT_Tbl) -> List[Abbreviation]:
+    def _parse_table(
+            self, table_element: etree._Element
+        ) -> List[Abbreviation]:
         """Parse table into list of abbreviation entries"""
         abb_entries: Dict[str, List[str]] = {}
         rows = table_element.findall('.//w:tr', namespaces=self.NS)
@@ -150,6 +154,90 @@ class AbbreviationTableExtractor:
             for abb, descriptions in abb_entries.items()
         ]
 
+
+class AbbreviationTableLocator(DocumentVisitor):
+    """
+    Finds the first top-level table of the body following a section title
+    matching `section_patterns` and parses it.
+    """
+    parts = {'document'}
+
+    def __init__(self, extractor: AbbreviationTableExtractor):
+        self.extractor = extractor
+        self.found_section = False
+        self.table_index: Optional[int] = None
+        self.abbreviations: List[Abbreviation] = []
+
+    def visit_paragraph(self, paragraph: DocxParagraph) -> None:
+        if (
+            not self.found_section
+            and paragraph.table is None
+            and not paragraph.text_box
+            and self.extractor.is_section_title(paragraph)
+        ):
+            self.found_section = True
+
+    def visit_table(
+            self,
+            element: etree._Element,
+            index: int,
+            part: str
+        ) -> None:
+        if self.found_section and self.table_index is None:
+            self.table_index = index
+            self.abbreviations = self.extractor._parse_table(element)
+            self.finished = True
+
+
+class RelevantTextCollector(DocumentVisitor):
+    """
+    Collects paragraph texts, excluding `skip_sections` and the table found
+    by the locator. The exclusion starts at the section title in bold or
+    heading style and resumes at the next bold or heading section of the
+    same part.
+    """
+
+    def __init__(
+            self,
+            skip_sections: Set[str],
+            locator: AbbreviationTableLocator
+        ):
+        self.skip_sections = skip_sections
+        self.locator = locator
+        self.paragraphs: List[str] = []
+        self.skip = False
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self.paragraphs)
+
+    def start_part(self, part: str) -> None:
+        self.skip = False
+
+    def visit_paragraph(self, para: DocxParagraph) -> None:
+        if (
+            para.table is not None
+            and para.part == 'document'
+            and para.table == self.locator.table_index
+        ):
+            return
+
+        para_text = para.text.strip()
+        if not para_text:
+            return
+
+        # Only top-level paragraphs open and close sections
+        is_block = para.table is None and not para.text_box
+        if is_block and (para.is_bold or para.is_heading):
+            para_text_upper = para_text.upper()
+            if any(section in para_text_upper for section in self.skip_sections):
+                self.skip = True
+            elif self.skip:
+                self.skip = False
+
+        if not self.skip:
+            self.paragraphs.append(para_text)
+
 # -----------------------------------------------------------------------------
 # Text, abbreviation, and context extraction
 # -----------------------------------------------------------------------------
@@ -162,98 +250,224 @@ class TextProcessor:
     def __init__(
             self,
             skip_sections: List[str] = SKIP_SECTIONS,
-            exclude_terms: Set[str] = EXCLUDE_TERMS
+            exclude_terms: Set[str] = EXCLUDE_TERMS,
+            section_patterns: List[str] = SECTION_PATTERNS
         ):
         self.skip_sections = {
                 section.upper() for section in skip_sections
             }
         self.exclude_terms = exclude_terms
+        self.table_extractor = AbbreviationTableExtractor(section_patterns)
 
-    def extract_relevant_text(self, doc: Document) -> str:
+    def extract_relevant_text(self, doc: DocxReader) -> str:
         """
-        Extracts text from the document, excluding `skip_sections`.
-        The exclusion starts at the section title in bold or heading style
-        and resumes at the next bold or heading section.
+        Extracts text of the body (with tables and text boxes), headers,
+        footers, footnotes and endnotes, excluding `skip_sections` and the
+        abbreviation table of the document.
         """
-        paragraphs = []
-        skip = False
-        
-        for i, para in enumerate(doc.paragraphs):
-            para_text = para.text.strip()
-            if not para_text:
-                continue
-                
-            try:
-                style_name = None
-                if hasattr(para, 'style') and para.style:
-                    try:
-                        style_name = para.style.name
-                    except:
-                        style_name = None
-                        
-                is_heading = (
-                    style_name and 
-                    (style_name.startswith('Heading') or 'Заголовок' in style_name)
-                )
-                
-            except Exception:
-                is_heading = False
-            
-            is_bold = False
-            if not is_heading:
-                for run in para.runs:
-                    if run.text.strip() and run.bold:
-                        is_bold = True
-                        break
-
-            if (is_bold or is_heading):
-                para_text_upper = para_text.upper()
-                if any(section in para_text_upper for section in self.skip_sections):
-                    skip = True
-                elif skip:
-                    skip = False
+        return self.read_document(doc)[1]
 
-            if not skip:
-                paragraphs.append(para_text)
-
-        return ' '.join(paragraphs)
+    def read_document(self, doc: DocxReader) -> Tuple[List[Abbreviation], str]:
+        """
+        Reads the abbreviation table and the relevant text of the document
+        in a single walk.
+        """
+        locator = AbbreviationTableLocator(self.table_extractor)
+        collector = RelevantTextCollector(self.skip_sections, locator)
+        DocumentWalker(doc).walk(locator, collector)
+        return locator.abbreviations, collector.text
 
     def extract_abbreviations(
         self,
         text: str,
         known_abbreviations: Set[str]
     ) -> Counter[str]:
+        """Count abbreviations in text, see `index_abbreviations`."""
+        return Counter({
+            candidate: len(offsets)
+            for candidate, offsets in self.index_abbreviations(
+                text, known_abbreviations
+            ).items()
+        })
+
+    def index_abbreviations(
+        self,
+        text: str,
+        known_abbreviations: Set[str],
+        automaton: Optional['ContextFinder'] = None
+    ) -> Dict[str, array]:
         """
-        Extract abbreviations from text.
+        Extract abbreviations from text with the character offsets of their
+        occurrences, in order of first appearance.
 
         Exact dictionary matches are always included. Unknown tokens must satisfy
         the abbreviation heuristics. Compound and derived forms are removed when
         their standalone abbreviations are already present.
+        Dictionary entries that are not single tokens, like 'p value' or
+        'т.е.', are found by `automaton`, see `AbbreviationDictionary`.
         """
-        doc_abbs: Counter[str] = Counter()
+        masked_text = self._mask_quotes(text)
+        doc_abbs = self._index_tokens(masked_text, known_abbreviations)
+        if automaton is not None:
+            doc_abbs = self._merge_dictionary_hits(
+                doc_abbs, automaton.find_occurrences(masked_text)
+            )
+        self._remove_derived_forms(doc_abbs, known_abbreviations)
+        return doc_abbs
 
-        text_no_quotes = re.compile(r'«\S+?»|"[^"]+"').sub('', text)
+    def index_abbreviations_sharded(
+        self,
+        text: str,
+        known_abbreviations: Set[str],
+        executor: Executor,
+        shard_count: int,
+        window: int = 50,
+        max_contexts: int = 1000,
+        automaton: Optional['ContextFinder'] = None
+    ) -> Tuple[Dict[str, array], Dict[str, List[str]]]:
+        """
+        Same result as `index_abbreviations` followed by `build_contexts`,
+        computed on `shard_count` shards of the text in `executor`.
+
+        Shards end on whitespace, so no token is split, and overlap by
+        `window` characters to build the contexts near their edges. Compound
+        forms are removed after merging, as they depend on the whole text.
+        Dictionary entries of several tokens can cross a shard boundary, so
+        `automaton` scans the whole text while the shards are processed.
+        """
+        masked_text = self._mask_quotes(text)
+        text_length = len(text)
 
-        for word in text_no_quotes.split():
-            candidate = self._clean_abbreviation(word)
+        boundaries = [0]
+        for shard in range(1, shard_count):
+            match = WHITESPACE_PATTERN.search(
+                masked_text, max(boundaries[-1], text_length * shard // shard_count)
+            )
+            if match is None:
+                break
+            boundaries.append(match.start())
+        boundaries.append(text_length)
+
+        futures = []
+        for start, end in zip(boundaries, boundaries[1:]):
+            context_start = max(0, start - window)
+            futures.append(executor.submit(
+                _index_shard,
+                self,
+                masked_text[start:end],
+                start,
+                text[context_start:min(text_length, end + window)],
+                context_start,
+                known_abbreviations,
+                window,
+                max_contexts,
+            ))
+
+        hits = (
+            automaton.find_occurrences(masked_text)
+            if automaton is not None else {}
+        )
+
+        doc_abbs: Dict[str, array] = {}
+        shard_contexts: Dict[str, List[List[str]]] = {}
+        for future in futures:
+            shard_abbs, contexts = future.result()
+            for abb, offsets in shard_abbs.items():
+                if abb in doc_abbs:
+                    doc_abbs[abb].extend(offsets)
+                else:
+                    doc_abbs[abb] = offsets
+                shard_contexts.setdefault(abb, []).append(contexts[abb])
+
+        doc_abbs = self._merge_dictionary_hits(doc_abbs, hits)
+        for abb in hits:
+            shard_contexts[abb] = [build_contexts(
+                text, doc_abbs[abb], len(abb), window, max_contexts
+            )]
+        self._remove_derived_forms(doc_abbs, known_abbreviations)
+
+        all_contexts: Dict[str, List[str]] = {}
+        for abb in doc_abbs:
+            merged: Dict[str, None] = {}
+            for contexts in shard_contexts[abb]:
+                merged.update(dict.fromkeys(contexts))
+            all_contexts[abb] = list(merged)[:max_contexts]
+
+        return doc_abbs, all_contexts
+
+    @staticmethod
+    def _mask_quotes(text: str) -> str:
+        """Quoted text is blanked out to keep offsets aligned with `text`."""
+        return QUOTED_TEXT_PATTERN.sub(
+            lambda match: ' ' * len(match.group()), text
+        )
+
+    def _index_tokens(
+        self,
+        text: str,
+        known_abbreviations: Set[str],
+        base_offset: int = 0
+    ) -> Dict[str, array]:
+        """Finds abbreviation candidates before compound forms are removed."""
+        # Identical tokens are grouped to classify each of them only once
+        tokens: Dict[str, List[int]] = {}
+        for match in TOKEN_PATTERN.finditer(text):
+            word = match.group()
+            starts = tokens.get(word)
+            if starts is None:
+                tokens[word] = [match.start()]
+            else:
+                starts.append(match.start())
+
+        doc_abbs: Dict[str, array] = {}
+        merged = set()
+        for word, starts in tokens.items():
+            candidate, shift, is_candidate = self._classify_token(word)
             if not candidate:
                 continue
 
-            if candidate in known_abbreviations:
-                doc_abbs[candidate] += 1
+            if candidate not in known_abbreviations and (
+                not is_candidate or candidate in self.exclude_terms
+            ):
                 continue
 
-            if not re.search(r'[A-ZА-ЯЁ].*[A-ZА-ЯЁ]', candidate):
-                continue
-            if self._is_roman_token(candidate):
-                continue
-            if candidate in self.exclude_terms:
-                continue
-            if len(candidate) > 8 and candidate.isalpha():
-                continue
+            shift += base_offset
+            offsets = doc_abbs.get(candidate)
+            if offsets is None:
+                doc_abbs[candidate] = array(
+                    'I', [start + shift for start in starts]
+                )
+            else:
+                offsets.extend(start + shift for start in starts)
+                merged.add(candidate)
+
+        # Several raw tokens can clean to one candidate, e.g. 'ABC,' and 'ABC'
+        for candidate in merged:
+            doc_abbs[candidate] = array('I', sorted(doc_abbs[candidate]))
 
-            doc_abbs[candidate] += 1
+        return doc_abbs
 
+    @staticmethod
+    def _merge_dictionary_hits(
+        doc_abbs: Dict[str, array],
+        hits: Dict[str, List[int]]
+    ) -> Dict[str, array]:
+        """Adds automaton hits keeping the order of first appearance."""
+        if not hits:
+            return doc_abbs
+
+        for entry, starts in hits.items():
+            offsets = doc_abbs.get(entry)
+            if offsets is not None:
+                starts = sorted(set(offsets).union(starts))
+            doc_abbs[entry] = array('I', starts)
+        return dict(sorted(doc_abbs.items(), key=lambda item: item[1][0]))
+
+    def _remove_derived_forms(
+        self,
+        doc_abbs: Dict[str, array],
+        known_abbreviations: Set[str]
+    ) -> None:
         standalone = set(doc_abbs)
 
         for candidate in list(doc_abbs):
@@ -269,26 +483,62 @@ class TextProcessor:
                 del doc_abbs[candidate]
                 continue
 
-            for abbreviation in standalone:
-                if abbreviation == candidate:
-                    continue
+            if self._is_derived_form(candidate, standalone):
+                del doc_abbs[candidate]
 
-                if candidate.startswith(f'{abbreviation}-'):
-                    affix = candidate[len(abbreviation) + 1:]
-                elif candidate.endswith(f'-{abbreviation}'):
-                    affix = candidate[:-len(abbreviation) - 1]
-                else:
-                    continue
+    @staticmethod
+    def _is_derived_form(candidate: str, standalone: Set[str]) -> bool:
+        """
+        Checks if candidate is a standalone abbreviation joined by a hyphen
+        with a Cyrillic word, e.g. 'ЭКГ-исследование' or 'анти-IgG'.
 
-                if (
-                    len(affix) >= 2
-                    and re.fullmatch(r'[А-Яа-яЁё]+', affix)
-                    and re.search(r'[а-яё]', affix)
-                ):
-                    del doc_abbs[candidate]
-                    break
+        The word cannot contain a hyphen, so only the head before the last
+        hyphen and the tail after the first one are looked up.
+        """
+        if '-' not in candidate:
+            return False
 
-        return doc_abbs
+        head, affix = candidate.rsplit('-', 1)
+        if head in standalone and TextProcessor._is_cyrillic_affix(affix):
+            return True
+
+        affix, tail = candidate.split('-', 1)
+        return tail in standalone and TextProcessor._is_cyrillic_affix(affix)
+
+    @staticmethod
+    def _is_cyrillic_affix(affix: str) -> bool:
+        return bool(
+            len(affix) >= 2
+            and CYRILLIC_WORD_PATTERN.fullmatch(affix)
+            and CYRILLIC_LOWERCASE_PATTERN.search(affix)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=TOKEN_CACHE_SIZE)
+    def _classify_token(word: str) -> Tuple[str, int, bool]:
+        """
+        Cleans a raw token and applies the dictionary-independent heuristics.
+        Returns the candidate, its offset within the token and whether it
+        looks like an abbreviation.
+        """
+        candidate = TextProcessor._clean_abbreviation(word)
+        if not candidate:
+            return '', 0, False
+
+        is_candidate = bool(
+            TWO_CAPITALS_PATTERN.search(candidate)
+            and not TextProcessor._is_roman_token(candidate)
+            and not (len(candidate) > 8 and candidate.isalpha())
+        )
+        return candidate, word.find(candidate), is_candidate
+
+    @staticmethod
+    def is_token_form(abbreviation: str) -> bool:
+        """Checks if a dictionary entry can be found as a single token."""
+        return (
+            not WHITESPACE_PATTERN.search(abbreviation)
+            and TextProcessor._clean_abbreviation(abbreviation) == abbreviation
+        )
 
     @staticmethod
     def _is_roman_token(candidate: str) -> bool:
@@ -301,7 +551,8 @@ class TextProcessor:
             for part in parts
         )
 
-    def _clean_abbreviation(self, match: str) -> str:
+    @staticmethod
+    def _clean_abbreviation(match: str) -> str:
         """Helper method to clean and format abbreviation matches."""
         clean_match = match.strip(':;,.»«][')
 
@@ -309,7 +560,7 @@ class TextProcessor:
         if clean_match.startswith('('):
             clean_match = clean_match[1:]
         if clean_match.endswith(')') and clean_match.count('(') == 0:
-            clean_match = re.sub(r'\)+$', '', clean_match)
+            clean_match = TRAILING_PARENTHESES_PATTERN.sub('', clean_match)
         
         return clean_match.strip('»«][')
 
@@ -319,55 +570,328 @@ class TextProcessor:
             abbreviation: str,
             window: int = 50,
             max_contexts: int = 1000
-        ) -> Union[str, List[str]]:
+        ) -> List[str]:
         """
         Finds and returns snippets of text around occurrences of the abbreviation.
         Limits the number of contexts returned to `max_contexts`.
         """
-        contexts: Set[str] = set()
-        matches = re.finditer(
-            rf'(?<!\w){re.escape(abbreviation)}(?!\w)', text
+        contexts = ContextFinder([abbreviation]).find_contexts(
+            text, window=window, max_contexts=max_contexts
         )
-        for match in matches:
-            start = max(0, match.start() - window)
-            end = min(len(text), match.end() + window)
-            snippet = "..." + text[start:end].strip() + "..."
-            if max_contexts == 1:
-                return [snippet]
-            contexts.add(snippet)
-            
-        return list(contexts)
+        return contexts.get(abbreviation, [])
+
+
+class ContextFinder:
+    """
+    Finds occurrences of many abbreviations in a single pass over text.
+
+    Abbreviations are stored in a character trie. Matching starts only at
+    positions not preceded by a word character and is accepted only if the
+    next character is not a word character, as `(?<!\\w)ABB(?!\\w)` does.
+
+    With an executor, abbreviations are split into `task_count` groups, each
+    searched by one alternation of the `regex` module. It releases the GIL
+    while matching, so threads of the executor scan the same text in
+    parallel.
+    """
+    TERMINAL = ''
+
+    def __init__(self, abbreviations: Iterable[str]):
+        self.trie: Dict[str, dict] = {}
+        for abbreviation in abbreviations:
+            if not abbreviation:
+                continue
+            node = self.trie
+            for char in abbreviation:
+                node = node.setdefault(char, {})
+            node[self.TERMINAL] = abbreviation
+
+        # Candidate start positions are located by the regex engine
+        self.start_pattern = None
+        if self.trie:
+            first_chars = ''.join(re.escape(char) for char in sorted(self.trie))
+            self.start_pattern = re.compile(rf'(?<!\w)[{first_chars}]')
+
+        self._abbreviations = sorted(self._iter_abbreviations(self.trie), key=len)
+        self._group_patterns: Dict[int, List[regex.Pattern]] = {}
+
+    def find_occurrences(
+            self,
+            text: str,
+            executor: Optional[Executor] = None,
+            task_count: int = 1
+        ) -> Dict[str, List[int]]:
+        """Returns start offsets of every abbreviation occurrence in text."""
+        if executor is not None:
+            return self._find_occurrences_concurrent(text, executor, task_count)
+
+        occurrences: Dict[str, List[int]] = {}
+        if self.start_pattern is None:
+            return occurrences
+
+        text_length = len(text)
+        for match in self.start_pattern.finditer(text):
+            start = match.start()
+            position = start
+            node = self.trie
+            while position < text_length:
+                node = node.get(text[position])
+                if node is None:
+                    break
+                position += 1
+
+                abbreviation = node.get(self.TERMINAL)
+                if abbreviation is not None and (
+                    position == text_length
+                    or not is_word_char(text[position])
+                ):
+                    occurrences.setdefault(abbreviation, []).append(start)
+
+        return occurrences
+
+    def find_contexts(
+            self,
+            text: str,
+            window: int = 50,
+            max_contexts: int = 1000,
+            executor: Optional[Executor] = None,
+            task_count: int = 1
+        ) -> Dict[str, List[str]]:
+        """Returns context snippets for every abbreviation found in text."""
+        occurrences = self.find_occurrences(text, executor, task_count)
+        return {
+            abbreviation: build_contexts(
+                text, starts, len(abbreviation), window, max_contexts
+            )
+            for abbreviation, starts in occurrences.items()
+        }
+
+    def _find_occurrences_concurrent(
+            self,
+            text: str,
+            executor: Executor,
+            task_count: int
+        ) -> Dict[str, List[int]]:
+        """
+        Searches groups of abbreviations in parallel. The result is ordered
+        as in the single pass: by first occurrence, shorter ones first.
+        """
+        futures = [
+            executor.submit(self._search, pattern, text)
+            for pattern in self._get_group_patterns(task_count)
+        ]
+        occurrences: Dict[str, List[int]] = {}
+        for future in futures:
+            occurrences.update(future.result())
+
+        return dict(sorted(
+            occurrences.items(),
+            key=lambda item: (item[1][0], len(item[0]))
+        ))
+
+    @staticmethod
+    def _search(pattern: regex.Pattern, text: str) -> Dict[str, List[int]]:
+        occurrences: Dict[str, List[int]] = {}
+        for match in pattern.finditer(text, overlapped=True, concurrent=True):
+            occurrences.setdefault(match.group(), []).append(match.start())
+        return occurrences
+
+    def _get_group_patterns(self, task_count: int) -> List[regex.Pattern]:
+        """
+        An alternation reports one match per position, so abbreviations
+        that can match at the same start, like `ALT` and `ALT/AST`, are put
+        into different groups.
+        """
+        if task_count in self._group_patterns:
+            return self._group_patterns[task_count]
+
+        groups: List[Set[str]] = [set() for _ in range(max(1, task_count))]
+        for index, abbreviation in enumerate(self._abbreviations):
+            prefixes = {
+                abbreviation[:end] for end in range(1, len(abbreviation))
+                if not is_word_char(abbreviation[end])
+            }
+            for shift in range(len(groups)):
+                group = groups[(index + shift) % len(groups)]
+                if prefixes.isdisjoint(group):
+                    group.add(abbreviation)
+                    break
+            else:
+                groups.append({abbreviation})
+
+        patterns = [
+            regex.compile(
+                rf'(?<!{WORD_CHAR_CLASS})(?:'
+                + '|'.join(regex.escape(abbreviation) for abbreviation in group)
+                + rf')(?!{WORD_CHAR_CLASS})'
+            )
+            for group in groups if group
+        ]
+        self._group_patterns[task_count] = patterns
+        return patterns
+
+    @classmethod
+    def _iter_abbreviations(cls, node: dict) -> Iterable[str]:
+        for char, child in node.items():
+            if char == cls.TERMINAL:
+                yield child
+            else:
+                yield from cls._iter_abbreviations(child)
+
+
+def is_word_char(char: str) -> bool:
+    """Same definition of a word character as `\\w` in `re`."""
+    return char.isalnum() or char == '_'
+
+
+# `\w` of `re` in the syntax of the `regex` module: letters and characters
+# with a numeric value, so isalnum() or '_'. The `\w` of `regex` also
+# matches combining marks and connector punctuation but not digits like
+# '²', so the threaded search would find other matches.
+WORD_CHAR_CLASS = r'[\p{L}\p{Nt=Decimal}\p{Nt=Digit}\p{Nt=Numeric}_]'
+
+
+def build_contexts(
+        text: str,
+        starts: Iterable[int],
+        length: int,
+        window: int = 50,
+        max_contexts: int = 1000
+    ) -> List[str]:
+    """
+    Builds unique snippets of `window` characters around each occurrence,
+    in order of appearance and limited to `max_contexts`.
+    """
+    contexts: Dict[str, None] = {}
+    text_length = len(text)
+    for start in starts:
+        snippet_start = max(0, start - window)
+        snippet_end = min(text_length, start + length + window)
+        snippet = "..." + text[snippet_start:snippet_end].strip() + "..."
+        contexts[snippet] = None
+        if len(contexts) >= max_contexts:
+            break
+
+    return list(contexts)
+
+def _index_shard(
+        processor: TextProcessor,
+        masked_text: str,
+        offset: int,
+        context_text: str,
+        context_offset: int,
+        known_abbreviations: Set[str],
+        window: int,
+        max_contexts: int
+    ) -> Tuple[Dict[str, array], Dict[str, List[str]]]:
+    """Indexes one shard of the text in a worker process."""
+    doc_abbs = processor._index_tokens(masked_text, known_abbreviations, offset)
+    contexts = {
+        abb: build_contexts(
+            context_text,
+            (start - context_offset for start in offsets),
+            len(abb),
+            window,
+            max_contexts
+        )
+        for abb, offsets in doc_abbs.items()
+    }
+    return doc_abbs, contexts
 
 # -----------------------------------------------------------------------------
 # Preparation of abbreviations
 # -----------------------------------------------------------------------------
 
+class AbbreviationDictionary:
+    """
+    Dictionary with the lookup structures used to process documents, built
+    once and shared by all documents processed against it.
+    """
+
+    def __init__(self, entries: List[Abbreviation]):
+        self.entries = entries
+        self.by_abbreviation = {entry['abbreviation']: entry for entry in entries}
+        self.abbreviations = set(self.by_abbreviation)
+        self.homoglyph_index = CharacterValidator().build_index(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @cached_property
+    def automaton(self) -> ContextFinder:
+        """Finds entries the tokenization can't reach, see `build_automaton`."""
+        return build_automaton(self.abbreviations)
+
+    @cached_property
+    def suggestion_index(self) -> 'SuggestionIndex':
+        return SuggestionIndex(self.abbreviations)
+
+
+def build_automaton(abbreviations: Iterable[str]) -> ContextFinder:
+    """
+    Compiles dictionary entries containing whitespace or punctuation removed
+    from tokens, like 'p value' or 'т.е.', into a trie scanning the text once.
+    """
+    return ContextFinder(
+        abbreviation for abbreviation in abbreviations
+        if not TextProcessor.is_token_form(abbreviation)
+    )
+
+
 def process_abbreviations(
-        doc: Document,
-        abb_dict: List[Abbreviation]
+        doc: DocxReader,
+        abb_dict: Union[List[Abbreviation], AbbreviationDictionary],
+        executor: Optional[Executor] = None,
+        shard_count: int = 1,
+        min_sharded_length: int = 0,
+        text: Optional[str] = None
     ) -> List[Abbreviation]:
-    """Process abbreviations found in document"""
+    """
+    Process abbreviations found in document.
+    `abb_dict` is a list of entries, an `AbbreviationDictionary` or
+    a `DictionarySnapshot` sharing its interface.
+    `text` is the relevant text if it was already read from the document.
+    Texts of `min_sharded_length` characters or more are split into
+    `shard_count` shards processed in `executor`.
+    """
     text_processor = TextProcessor()
     validator = CharacterValidator()
-    
-    # Get abbreviations from document text
-    dictionary = {
-        entry['abbreviation']: entry
-        for entry in abb_dict
-    }
-
-    text = text_processor.extract_relevant_text(doc)
-    raw_abbs = text_processor.extract_abbreviations(
-        text,
-        set(dictionary)
-    )
+    if isinstance(abb_dict, list):
+        abb_dict = AbbreviationDictionary(abb_dict)
+    dictionary = abb_dict.by_abbreviation
+
+    if text is None:
+        text = text_processor.extract_relevant_text(doc)
+    if (
+        executor is not None
+        and shard_count > 1
+        and len(text) >= min_sharded_length
+    ):
+        abb_index, all_contexts = text_processor.index_abbreviations_sharded(
+            text,
+            abb_dict.abbreviations,
+            executor,
+            shard_count,
+            automaton=abb_dict.automaton
+        )
+    else:
+        abb_index = text_processor.index_abbreviations(
+            text,
+            abb_dict.abbreviations,
+            abb_dict.automaton
+        )
+        all_contexts = {
+            abb: build_contexts(text, offsets, len(abb))
+            for abb, offsets in abb_index.items()
+        }
     processed_abbs: List[Abbreviation] = []
     
-    for abb, count in raw_abbs.items():
-        contexts = text_processor.find_abbreviation_context(text, abb)
+    for abb, offsets in abb_index.items():
+        count = len(offsets)
+        contexts = all_contexts[abb]
         
         dict_entry = dictionary.get(abb)
-        descriptions = dict_entry['descriptions'] if dict_entry else []
+        descriptions = list(dict_entry['descriptions']) if dict_entry else []
         is_ai_generated = False        
             
         processed_abb: Abbreviation = {
@@ -379,25 +903,32 @@ def process_abbreviations(
             'correct_form': None,
             'highlighted': None,
             'status': None,
-            'is_ai_generated': is_ai_generated
+            'is_ai_generated': is_ai_generated,
+            'suggestions': []
         }
             
-        # Validate and update if it's 9 or less characters long
-        if len(abb) <= 15:
-            try:
-                val_result = validator.validate_abbreviation(abb, abb_dict)
-                if val_result:
-                    val_descriptions = val_result.get('descriptions', [])
-                    processed_abb.update({
-                        'correct_form': val_result.get('correct_form'),
-                        'highlighted': val_result.get('highlighted'),
-                        'descriptions': (
-                            val_descriptions if val_descriptions 
-                            else processed_abb['descriptions']
-                        )
-                    })
-            except ValueError:
-                pass
+        try:
+            val_result = validator.validate_abbreviation(
+                abb, abb_dict.homoglyph_index
+            )
+            if val_result:
+                val_descriptions = val_result.get('descriptions', [])
+                processed_abb.update({
+                    'correct_form': val_result.get('correct_form'),
+                    'highlighted': val_result.get('highlighted'),
+                    'descriptions': (
+                        val_descriptions if val_descriptions 
+                        else processed_abb['descriptions']
+                    )
+                })
+        except ValueError:
+            pass
+
+        if not processed_abb['descriptions']:
+            processed_abb['suggestions'] = [
+                dictionary[suggestion]
+                for suggestion in abb_dict.suggestion_index.suggest(abb)
+            ]
             
         processed_abbs.append(processed_abb)
     
@@ -527,21 +1058,30 @@ class CharacterValidator:
                             for k, v in self.cyr2lat.items()})
         # Create reverse mapping
         self.lat2cyr = {v: k for k, v in self.cyr2lat.items()}
+        # Folds look-alikes to Latin, see `HomoglyphIndex`
+        self.skeleton_table = str.maketrans(self.cyr2lat)
+
+    def build_index(self, abb_dict: List[Abbreviation]) -> 'HomoglyphIndex':
+        """Indexes the dictionary for `validate_abbreviation`."""
+        return HomoglyphIndex(abb_dict, self.skeleton_table)
 
     def validate_abbreviation(
             self, 
             abb: str, 
-            abb_dict: List[Abbreviation]
+            abb_dict: Union[List[Abbreviation], 'HomoglyphIndex']
         ) -> dict:
         """
         Validates an abbreviation for mixed characters.
         Checks for existing forms in the dictionary.
         Returns a dict with validation info or empty dict.
 
+        Pass an index from `build_index` to validate many abbreviations
+        against the same dictionary.
+
         Decision Tree (important returns are shown):
         Abbreviation
         └─ has_cyr_chars OR has_lat_chars
-            ├─ Generate forms and search the dictionary
+            ├─ Look up forms with the same skeleton in the dictionary
             │    ├─ Match found (does not matter mixed or not)
             │    │    ├─ correct_form = matched_form
             │    │    ├─ descriptions = matched_description
@@ -562,12 +1102,9 @@ class CharacterValidator:
         if not (has_cyr_chars or has_lat_chars):
             return {}
     
-        # Generate all possible forms and search dictionary
-        possible_forms = self._generate_all_mixed_forms(abb)
-        matched_entries = [
-            entry for entry in abb_dict 
-            if entry['abbreviation'] in possible_forms
-        ]
+        if isinstance(abb_dict, list):
+            abb_dict = self.build_index(abb_dict)
+        matched_entries = abb_dict.lookup(abb)
     
         if matched_entries:
             # Check for multiple matches
@@ -597,39 +1134,6 @@ class CharacterValidator:
 
         return {}
 
-    def _generate_all_mixed_forms(self, abb: str) -> set:
-        """Generate all possible character combinations"""
-        results = set()
-        
-        # Add full conversions
-        results.add("".join(self.lat2cyr.get(ch, ch) for ch in abb))
-        results.add("".join(self.cyr2lat.get(ch, ch) for ch in abb))
-        
-        # Generate partial conversions
-        def backtrack(i: int, current: list):
-            if i == len(abb):
-                results.add("".join(current))
-                return
-
-            ch = abb[i]
-            # Original character
-            current.append(ch)
-            backtrack(i + 1, current)
-            current.pop()
-
-            # Convert if possible
-            if ch in self.cyr2lat:
-                current.append(self.cyr2lat[ch])
-                backtrack(i + 1, current)
-                current.pop()
-            if ch in self.lat2cyr:
-                current.append(self.lat2cyr[ch])
-                backtrack(i + 1, current)
-                current.pop()
-
-        backtrack(0, [])
-        return results - {abb}  # Exclude original form
-
     def _highlight_mismatch_characters(
             self, user_abb: str, dict_abb: str
             ) -> str:
@@ -674,6 +1178,211 @@ class CharacterValidator:
                 highlighted.append(ch)
         return "".join(highlighted)
 
+
+class HomoglyphIndex:
+    """
+    Dictionary entries keyed by their skeleton, the form with every Cyrillic
+    look-alike folded to its Latin counterpart. All mixed forms of an
+    abbreviation share its skeleton, so they are found with one lookup.
+    """
+
+    def __init__(self, abb_dict: List[Abbreviation], skeleton_table: dict):
+        self.skeleton_table = skeleton_table
+        self.entries: Dict[str, List[Abbreviation]] = {}
+        for entry in abb_dict:
+            self.entries.setdefault(
+                self.skeleton(entry['abbreviation']), []
+            ).append(entry)
+
+    def skeleton(self, abb: str) -> str:
+        return abb.translate(self.skeleton_table)
+
+    def lookup(self, abb: str) -> List[Abbreviation]:
+        """Entries spelled as `abb` with other look-alike characters."""
+        return [
+            entry for entry in self.entries.get(self.skeleton(abb), ())
+            if entry['abbreviation'] != abb
+        ]
+
+class SuggestionIndex:
+    """
+    Dictionary entries close to an unknown abbreviation, like 'HbA1c' for
+    'HbA1C' or 'ALT-AST' for 'ALTAST'.
+
+    Symmetric delete search (SymSpell): entries are indexed by all forms of
+    their first `prefix_length` characters with up to `max_distance`
+    characters deleted. A lookup generates the same deletes of the query
+    and checks only the entries sharing one of them.
+    """
+
+    def __init__(
+            self,
+            abbreviations: Iterable[str],
+            max_distance: int = 2,
+            prefix_length: int = 7
+        ):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes: Dict[str, List[str]] = {}
+        for abbreviation in abbreviations:
+            for form in self._deletes(abbreviation):
+                self.deletes.setdefault(form, []).append(abbreviation)
+
+    def suggest(self, abb: str, limit: int = 3) -> List[str]:
+        """
+        Closest entries by edit distance with transpositions. Abbreviations
+        of up to 4 characters allow a single edit, as two edits of such
+        a short string match unrelated entries.
+        """
+        max_distance = 1 if len(abb) <= 4 else self.max_distance
+        candidates = set()
+        for form in self._deletes(abb, max_distance):
+            candidates.update(self.entries(form))
+        candidates.discard(abb)
+
+        scored = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(abb)) > max_distance:
+                continue
+            distance = edit_distance(abb, candidate)
+            if distance <= max_distance:
+                scored.append((distance, candidate))
+        return [candidate for _, candidate in sorted(scored)[:limit]]
+
+    def entries(self, form: str) -> Iterable[str]:
+        """Entries with `form` among their deletes."""
+        return self.deletes.get(form, ())
+
+    def _deletes(
+            self,
+            abb: str,
+            max_distance: Optional[int] = None
+        ) -> Set[str]:
+        if max_distance is None:
+            max_distance = self.max_distance
+        forms = {abb[:self.prefix_length]}
+        edge = forms
+        for _ in range(max_distance):
+            edge = {
+                form[:index] + form[index + 1:]
+                for form in edge if len(form) > 1
+                for index in range(len(form))
+            }
+            forms |= edge
+        return forms
+
+
+def edit_distance(source: str, target: str) -> int:
+    """
+    Optimal string alignment distance: insertions, deletions, substitutions
+    and transpositions of adjacent characters.
+
+    Bit-parallel algorithm of Myers with the transposition extension of
+    Hyyrö: each character of `target` updates the whole column of `source`
+    with a few integer operations.
+    """
+    length = len(source)
+    if not length:
+        return len(target)
+
+    masks: Dict[str, int] = {}
+    for index, char in enumerate(source):
+        masks[char] = masks.get(char, 0) | (1 << index)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+
+    positive, negative, distance = full, 0, length
+    diagonal = previous_match = 0
+    for char in target:
+        match = masks.get(char, 0)
+        transposition = ((~diagonal & match) << 1) & previous_match
+        diagonal = (
+            (((match & positive) + positive) ^ positive)
+            | match | negative | transposition
+        ) & full
+        horizontal_positive = (negative | ~(diagonal | positive)) & full
+        horizontal_negative = positive & diagonal
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = (
+            horizontal_negative | ~(diagonal | horizontal_positive)
+        ) & full
+        negative = horizontal_positive & diagonal
+        previous_match = match
+    return distance
+
+
+# -----------------------------------------------------------------------------
+# Similar descriptions
+# -----------------------------------------------------------------------------
+
+class DescriptionIndex:
+    """
+    Existing descriptions of each abbreviation with their character
+    trigrams, to find near-duplicates of a new description.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]] = ()):
+        self.descriptions: Dict[str, List[Tuple[str, str, Set[str]]]] = {}
+        for abbreviation, description in entries:
+            self.add(abbreviation, description)
+
+    def add(self, abbreviation: str, description: str) -> None:
+        normalized = self.normalize(description)
+        self.descriptions.setdefault(abbreviation, []).append(
+            (description, normalized, self.trigrams(normalized))
+        )
+
+    def similar(
+            self,
+            abbreviation: str,
+            text: str,
+            threshold: float = 0.5,
+            limit: int = 5
+        ) -> List[str]:
+        """
+        Descriptions of `abbreviation` whose trigrams have a Dice
+        coefficient of at least `threshold` with `text`, most similar first.
+        """
+        trigrams = self.trigrams(self.normalize(text))
+        if not trigrams:
+            return []
+
+        scored = []
+        for description, _, other in self.descriptions.get(abbreviation, ()):
+            shared = len(trigrams & other)
+            score = 2 * shared / (len(trigrams) + len(other))
+            if score >= threshold:
+                scored.append((-score, description))
+        return [description for _, description in sorted(scored)[:limit]]
+
+    def find_duplicate(self, abbreviation: str, text: str) -> Optional[str]:
+        """
+        Existing description of `abbreviation` that differs from `text`
+        only in case, punctuation or spacing.
+        """
+        normalized = self.normalize(text)
+        for description, other, _ in self.descriptions.get(abbreviation, ()):
+            if other == normalized:
+                return description
+        return None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return ' '.join(re.findall(r'\w+', text.casefold().replace('ё', 'е')))
+
+    @staticmethod
+    def trigrams(normalized: str) -> Set[str]:
+        if not normalized:
+            return set()
+        padded = f' {normalized} '
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
 # -----------------------------------------------------------------------------
 # Abbreviation comparison
 # -----------------------------------------------------------------------------
@@ -836,20 +1545,63 @@ class AbbreviationTableGenerator:
 # Alphabet detection for cleaning the abbreviation dictionary
 # -----------------------------------------------------------------------------
 
+class ScriptClassifier:
+    """Script classes of code points precomputed into a `str.translate`
+    table, so a string is classified by one `translate` call instead of a
+    regex search per script and word.
+    """
+    CYRILLIC = 'C'
+    LATIN = 'L'
+    WORD = 'N'          # digits, '_' and '-' joining words
+    PUNCTUATION = 'P'   # trailing punctuation kept with a word
+    SPACE = 'S'
+
+    # Runs of letters with trailing punctuation, or single other characters.
+    # Unmapped characters are left as they are in the mask and fall into the
+    # second alternative like any other non-space character.
+    TOKEN_PATTERN = re.compile(r'[CLN]+P*|[^S]')
+
+    def __init__(self):
+        # No code point of these classes lies above U+30000
+        all_chars = ''.join(map(chr, range(0x30000)))
+        table = {}
+        # Later classes win, letters of a script over numbers
+        for pattern, code in (
+            (r'\s', self.SPACE),
+            (r'[.,;:!?]', self.PUNCTUATION),
+            (r'[\p{N}_-]', self.WORD),
+            (r'\p{Script=Latin}', self.LATIN),
+            (r'\p{Script=Cyrillic}', self.CYRILLIC),
+        ):
+            for char in regex.findall(pattern, all_chars):
+                table[ord(char)] = code
+        self.table = table
+
+    def mask(self, text):
+        """String of the class code of each character of `text`."""
+        return text.translate(self.table)
+
+    def alphabet(self, mask):
+        has_russian = self.CYRILLIC in mask
+        has_latin = self.LATIN in mask
+        if has_russian and has_latin:
+            return 'mixed'
+        elif has_russian:
+            return 'russian'
+        elif has_latin:
+            return 'latin'
+        return 'other'
+
+@lru_cache(maxsize=1)
+def get_script_classifier():
+    return ScriptClassifier()
+
 def detect_string_alphabet(text):
     """Detect if string contains Russian, Latin or mixed characters.
     Returns: 'russian', 'latin', or 'mixed'
     """
-    has_russian = bool(regex.search(r'\p{Script=Cyrillic}', text))
-    has_latin   = bool(regex.search(r'\p{Script=Latin}', text))
-    
-    if has_russian and has_latin:
-        return 'mixed'
-    elif has_russian:
-        return 'russian'
-    elif has_latin:
-        return 'latin'
-    return 'other'
+    classifier = get_script_classifier()
+    return classifier.alphabet(classifier.mask(text))
 
 def split_by_language(text):
     """Split text into Russian and Latin parts while preserving compound terms.
@@ -858,21 +1610,85 @@ def split_by_language(text):
     russian_parts = []
     latin_parts = []
 
-    pattern = r'[\p{Script=Cyrillic}\p{Script=Latin}\p{N}_-]+[.,;:!?]*|\S'
-    words = regex.findall(pattern, text)
-
-    for word in words:
-        lang = detect_string_alphabet(word)
+    classifier = get_script_classifier()
+    mask = classifier.mask(text)
+    for match in classifier.TOKEN_PATTERN.finditer(mask):
+        lang = classifier.alphabet(match.group())
         if lang == 'russian':
-            russian_parts.append(word)
+            russian_parts.append(text[match.start():match.end()])
         elif lang == 'latin':
-            latin_parts.append(word)
+            latin_parts.append(text[match.start():match.end()])
 
     russian_text = ' '.join(russian_parts)
     latin_text = ' '.join(latin_parts)
 
     # Remove trailing punctuation
-    russian_text = regex.sub(r'[.,;:!?]+$', '', russian_text)
-    latin_text = regex.sub(r'[.,;:!?]+$', '', latin_text)
+    russian_text = russian_text.rstrip('.,;:!?')
+    latin_text = latin_text.rstrip('.,;:!?')
+
+    return russian_text, latin_text
+
+def validate_abbreviation_match(abb, desc):
+    """Check if the description contains words starting with the letters
+    of the abbreviation.
+    """
+    if not abb or not desc:
+        return False
+
+    abb_letters = [c for c in abb.upper() if c.isalpha()]
+
+    words = regex.findall(r'[\p{L}-]+', desc, regex.UNICODE)
+
+    first_letters = set()
+    for word in words:
+        if word:
+            first_letters.add(word[0].upper())
+        parts = word.split('-')
+        for part in parts[1:]:
+            if part:
+                first_letters.add(part[0].upper())
+
+    return all(letter in first_letters for letter in abb_letters)
+
+def clean_dictionary_entry(abb, desc):
+    """Keep the part of the description in the alphabet of the abbreviation.
+    Returns: (outcome, cleaned_desc, message), where outcome is 'one_letter',
+    'few_capitals', 'mixed', 'no_match', 'cleaned' or 'unchanged' and
+    message is the report line of the entry or None
+    """
+    # Skip one-letter abbreviations
+    if len(abb) == 1:
+        return 'one_letter', None, None
+
+    # Skip abbreviations without at least two capital letters
+    if not regex.search(r'\p{Lu}.*\p{Lu}', abb, regex.UNICODE):
+        return 'few_capitals', None, None
+
+    # Skip mixed-language abbreviations
+    abb_lang = detect_string_alphabet(abb)
+    if abb_lang == 'mixed':
+        return 'mixed', None, None
+
+    russian_desc, latin_desc = split_by_language(desc)
+    if abb_lang == 'russian' and russian_desc:
+        cleaned_desc, label = russian_desc, 'Russian'
+    elif abb_lang == 'latin' and latin_desc:
+        cleaned_desc, label = latin_desc, 'Latin'
+    else:
+        cleaned_desc, label = desc, None
+
+    if not validate_abbreviation_match(abb, cleaned_desc):
+        return (
+            'no_match', None,
+            f"Skipping due to no letter match: {abb} - {cleaned_desc}"
+        )
+    if cleaned_desc != desc:
+        return (
+            'cleaned', cleaned_desc,
+            f"Initial: {desc} -> Cleaned ({label}): {cleaned_desc}"
+        )
+    return 'unchanged', cleaned_desc, None
 
-    return russian_text, latin_text
\ No newline at end of file
+def clean_dictionary_entries(entries):
+    """Clean a chunk of (abbreviation, description) pairs, run by workers."""
+    return [clean_dictionary_entry(abb, desc) for abb, desc in entries]
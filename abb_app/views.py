@@ -3,30 +3,45 @@ import logging
 import os
 import secrets
 
-from datetime import timedelta
-from typing import Any, Dict, List, Union
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 
 from django.conf import settings
 from django.contrib import messages
+from django.core.cache import cache
 from django.core.files.storage import FileSystemStorage
 from django.http import FileResponse, HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
-from django.utils.timezone import now
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import ensure_csrf_cookie
-from django.views.decorators.http import require_http_methods
+from django.views.decorators.http import condition, require_http_methods
 
 from .document_session import (
     DEMO_FILENAME,
     delete_session_document,
     touch_session_document,
 )
-from .models import AbbreviationEntry
 from .uploads import UploadValidationError, validate_docx_upload
 from .utils import Abbreviation, compare_abbreviations
 from .services.abbreviations import (
+    find_abbreviation,
     get_selected_abbreviations,
     update_abbreviation_selection,
 )
+from .services.dictionary import (
+    CACHE_TIMEOUT,
+    get_description_index,
+    get_dictionary_modified,
+    get_dictionary_stamp,
+    get_dictionary_statistics,
+)
+from .services.search import (
+    PAGE_SIZE,
+    PAGE_SIZES,
+    decode_cursor,
+    encode_cursor,
+    search_entries,
+)
 from .services.documents import (
     build_abbreviation_table_docx,
     process_document,
@@ -228,6 +243,7 @@ def update_abbreviation(request: HttpRequest) -> JsonResponse:
             abbreviation=abbreviation,
             description=data.get('description'),
             action=data.get('action'),
+            description_index=get_description_index(),
         )
     except ValueError as exc:
         return JsonResponse(
@@ -239,6 +255,28 @@ def update_abbreviation(request: HttpRequest) -> JsonResponse:
     return JsonResponse({'success': True})
 
 
+@require_http_methods(['GET'])
+def similar_descriptions(request: HttpRequest) -> JsonResponse:
+    """Existing descriptions similar to the one being typed."""
+    try:
+        doc_abbs: List[Abbreviation] = request.session.get('doc_abbs', [])
+        entry = find_abbreviation(
+            doc_abbs,
+            request.GET.get('abbreviation', ''),
+        )
+    except ValueError as exc:
+        return JsonResponse(
+            {'success': False, 'error': str(exc)},
+            status=400,
+        )
+
+    similar = get_description_index().similar(
+        entry.get('correct_form') or entry['abbreviation'],
+        request.GET.get('description', ''),
+    )
+    return JsonResponse({'success': True, 'similar': similar})
+
+
 def process_and_display(
     request: HttpRequest,
     is_demo: bool = False,
@@ -315,31 +353,87 @@ def make_abbreviation_table(
         )
 
 
+def dictionary_etag(request: HttpRequest) -> Optional[str]:
+    return get_dictionary_stamp()
+
+
+def dictionary_last_modified(request: HttpRequest) -> Optional[datetime]:
+    return get_dictionary_modified()
+
+
 @require_http_methods(['GET'])
+@cache_control(no_cache=True)
+@condition(
+    etag_func=dictionary_etag,
+    last_modified_func=dictionary_last_modified,
+)
 def dictionary_view(request: HttpRequest) -> HttpResponse:
-    """Public view of the abbreviation dictionary."""
-    abbreviations = AbbreviationEntry.objects.filter(
-        status='approved'
-    ).order_by('abbreviation')
-
-    total_count = abbreviations.count()
-    last_month = now() - timedelta(days=30)
-    new_count = abbreviations.filter(
-        created_at__gte=last_month
-    ).count()
-    last_entry = abbreviations.order_by('-created_at').first()
-    last_update = last_entry.created_at if last_entry else None
-
-    return render(
+    """
+    Public view of the abbreviation dictionary. Only the first page is
+    rendered, the page loads the rest from `dictionary_entries`.
+
+    The rendered page is cached per dictionary stamp, unchanged pages are
+    answered with 304 by the conditional headers.
+    """
+    stamp = get_dictionary_stamp()
+    key = f'dictionary-page:{stamp}'
+    content = cache.get(key) if stamp else None
+    if content is not None:
+        return HttpResponse(content)
+
+    entries, next_cursor = search_entries()
+    response = render(
         request,
         'dictionary.html',
         {
-            'abbreviations': abbreviations,
-            'total_count': total_count,
-            'new_count': new_count,
-            'last_update': last_update,
+            'abbreviations': entries,
+            'next_cursor': encode_cursor(next_cursor),
+            'page_size': PAGE_SIZE,
+            'page_sizes': PAGE_SIZES,
+            **get_dictionary_statistics(),
         }
     )
+    if stamp:
+        cache.set(key, response.content, CACHE_TIMEOUT)
+    return response
+
+
+@require_http_methods(['GET'])
+def dictionary_entries(request: HttpRequest) -> JsonResponse:
+    """
+    Page of approved entries matching the dictionary page filters, in the
+    order and page size chosen on the page.
+    """
+    try:
+        limit = request.GET.get('limit', str(PAGE_SIZE))
+        if limit not in map(str, PAGE_SIZES):
+            raise ValueError('Invalid page size')
+        entries, next_cursor = search_entries(
+            abbreviation=request.GET.get('abbreviation', ''),
+            description=request.GET.get('description', ''),
+            after=decode_cursor(request.GET.get('cursor')),
+            limit=int(limit),
+            order=request.GET.get('order', 'abbreviation'),
+        )
+    except ValueError as exc:
+        return JsonResponse(
+            {'success': False, 'error': str(exc)},
+            status=400,
+        )
+
+    return JsonResponse({
+        'success': True,
+        'entries': [
+            {
+                'id': entry.pk,
+                'abbreviation': entry.abbreviation,
+                'description': entry.description,
+                'updated_at': entry.updated_at.strftime('%d.%m.%Y'),
+            }
+            for entry in entries
+        ],
+        'next_cursor': encode_cursor(next_cursor),
+    })
 
 
 @require_http_methods(['POST'])
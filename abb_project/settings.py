@@ -138,6 +138,26 @@ MAX_DOCX_UNCOMPRESSED_SIZE = 100 * 1024 * 1024
 DOCUMENT_SESSION_TIMEOUT_SECONDS = 10 * 60
 DATA_UPLOAD_MAX_NUMBER_FILES = 1
 
+# Abbreviation extraction of very large documents can be split between
+# processes. Every web worker starts its own pool, so it is opt-in: 1 keeps
+# extraction in the worker.
+EXTRACTION_WORKERS = int(os.environ.get('EXTRACTION_WORKERS', 1))
+PARALLEL_EXTRACTION_MIN_CHARS = 1_000_000
+
+# Threads searching contexts of abbreviations, 1 disables the threaded search
+CONTEXT_SEARCH_THREADS = int(
+    os.environ.get('CONTEXT_SEARCH_THREADS', min(8, os.cpu_count() or 1))
+)
+
+# Stamp of the approved dictionary, replaced whenever entries change
+DICTIONARY_VERSION_FILE = os.path.join(
+    BASE_DIR, 'abb_app', 'data', 'dictionary.version'
+)
+# Compiled dictionary shared by workers, see `build_dictionary_snapshot`
+DICTIONARY_SNAPSHOT_FILE = os.path.join(
+    BASE_DIR, 'abb_app', 'data', 'dictionary.snapshot'
+)
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 